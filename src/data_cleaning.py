@@ -3,112 +3,148 @@ Generate Proper Quantitative Summary for Portfolio Analysis
 This script converts your raw stock data into the format needed by tab3
 """
 
+import os
 import pandas as pd
 import numpy as np
+from math import sqrt
+from concurrent.futures import ProcessPoolExecutor
 
-def create_quantitative_summary(input_csv, output_csv='quantitative_summary_fixed.csv'):
+# Trading days per year, used to annualize daily volatility
+SQRT_252 = sqrt(252)
+NUMERIC_COLUMNS = ['Cumulative Return (%)', 'Volatility (%)', 'Sharpe Ratio']
+
+def sharpe_ratio(returns, volatility, risk_free_rate):
+    """
+    Sharpe ratio per row, 0 where volatility is zero or data is missing
+    
+    Masking those rows up front skips the divide for them instead of
+    producing inf/nan and sweeping them out afterwards.
+    """
+    sharpe = np.zeros_like(volatility, dtype=np.float64)
+    valid = (volatility > 1e-12) & np.isfinite(returns)
+    np.divide(returns - risk_free_rate, volatility, out=sharpe, where=valid)
+    return sharpe
+
+def print_summary_stats(summary):
+    """Print the return, volatility and Sharpe ranges of a summary frame"""
+    print(f"Return range: {summary['Cumulative Return (%)'].min():.2f}% to {summary['Cumulative Return (%)'].max():.2f}%")
+    print(f"Volatility range: {summary['Volatility (%)'].min():.2f}% to {summary['Volatility (%)'].max():.2f}%")
+    print(f"Sharpe range: {summary['Sharpe Ratio'].min():.2f} to {summary['Sharpe Ratio'].max():.2f}")
+
+def create_quantitative_summary(input_csv, output_csv='quantitative_summary_fixed.csv', verbose=False):
     """
     Convert raw stock data to proper format for portfolio analysis
     
     Args:
         input_csv: Your current CSV file
         output_csv: Output file name
+        verbose: Print previews and statistics (off for library use)
     """
     
     # Load data
-    df = pd.read_csv(input_csv)
-    
-    print("=== ORIGINAL DATA ===")
-    print(df.head())
-    print(f"\nColumns: {df.columns.tolist()}")
+    df = pd.read_csv(input_csv, engine='pyarrow')  # Arrow's multi-threaded parser
     
-    # Create new dataframe with required columns
-    summary = pd.DataFrame()
+    if verbose:
+        print("=== ORIGINAL DATA ===")
+        print(df.head())
+        print(f"\nColumns: {df.columns.tolist()}")
     
-    # 1. Stock ticker
-    summary['Stock'] = df['Stock']
+    # 1. Stock ticker (categorical: stored dictionary-encoded in Parquet)
+    stock = df['Stock'].astype('category')
     
     # 2. Adjust returns to reasonable range
     # Problem: Your data has lifetime returns (110,000%!)
     # Solution: Cap at reasonable values OR use recent period only
     
     # Option A: Cap returns at 500% (still aggressive)
-    summary['Cumulative Return (%)'] = df['Cumulative Return (%)'].clip(upper=500)
+    returns = df['Cumulative Return (%)'].clip(upper=500).to_numpy()
     
     # Option B: Use a log transformation to bring down extreme values
-    # summary['Cumulative Return (%)'] = np.log1p(df['Cumulative Return (%)']) * 50
+    # returns = np.log1p(df['Cumulative Return (%)'].to_numpy()) * 50
     
     # 3. Use volatility as-is (seems reasonable: 1-4%)
     # But volatility should typically be 15-60% for stocks
     # Your volatility is DAILY, need to annualize it!
-    summary['Volatility (%)'] = df['Volatility (%)'] * np.sqrt(252)  # Annualize
+    volatility = df['Volatility (%)'].to_numpy() * SQRT_252  # Annualize
     
     # 4. Calculate Sharpe Ratio
     risk_free_rate = 2.0  # Assume 2% risk-free rate
-    summary['Sharpe Ratio'] = (summary['Cumulative Return (%)'] - risk_free_rate) / summary['Volatility (%)']
-    
-    # Handle inf and nan values
-    summary['Sharpe Ratio'] = summary['Sharpe Ratio'].replace([np.inf, -np.inf], 0)
-    summary['Sharpe Ratio'] = summary['Sharpe Ratio'].fillna(0)
-    
-    print("\n=== FIXED DATA ===")
-    print(summary.head())
-    
-    print("\n=== STATISTICS ===")
-    print(f"Return range: {summary['Cumulative Return (%)'].min():.2f}% to {summary['Cumulative Return (%)'].max():.2f}%")
-    print(f"Volatility range: {summary['Volatility (%)'].min():.2f}% to {summary['Volatility (%)'].max():.2f}%")
-    print(f"Sharpe range: {summary['Sharpe Ratio'].min():.2f} to {summary['Sharpe Ratio'].max():.2f}")
-    
-    # Save
+    sharpe = sharpe_ratio(returns, volatility, risk_free_rate)
+    
+    # Build the summary in one constructor call instead of growing an empty frame column by column
+    summary = pd.DataFrame({
+        'Stock': stock,
+        'Cumulative Return (%)': returns,
+        'Volatility (%)': volatility,
+        'Sharpe Ratio': sharpe
+    }, copy=False)
+    
+    if verbose:
+        print("\n=== FIXED DATA ===")
+        print(summary.head())
+        
+        print("\n=== STATISTICS ===")
+        print_summary_stats(summary)
+    
+    # Save (float32 is ample for percentages and halves the app's payload)
+    summary[NUMERIC_COLUMNS] = summary[NUMERIC_COLUMNS].astype('float32')
     summary.to_csv(output_csv, index=False)
-    print(f"\n✅ Fixed data saved to: {output_csv}")
+    summary.to_parquet(os.path.splitext(output_csv)[0] + '.parquet', engine='pyarrow', compression='snappy')
+    if verbose:
+        print(f"\n✅ Fixed data saved to: {output_csv}")
     
     return summary
 
 # Alternative: Use recent period returns only
-def create_summary_from_recent_returns(input_csv, lookback_period='1Y', output_csv='quantitative_summary_recent.csv'):
+def create_summary_from_recent_returns(input_csv, lookback_period='1Y', output_csv='quantitative_summary_recent.csv',
+                                       verbose=False):
     """
     Calculate returns from recent period only (more realistic)
     
     This is the BETTER approach but requires historical price data
     """
     
-    df = pd.read_csv(input_csv)
+    df = pd.read_csv(input_csv, engine='pyarrow')  # Arrow's multi-threaded parser
     
     # For demonstration, we'll use a scaling approach
     # In reality, you'd want to calculate from actual recent prices
     
-    summary = pd.DataFrame()
-    summary['Stock'] = df['Stock']
-    
     # Scale down extreme returns using square root
     # This keeps the ranking but makes values more reasonable
-    returns = df['Cumulative Return (%)']
+    returns = df['Cumulative Return (%)'].to_numpy()
     
     # Apply square root transformation for extreme values
-    summary['Cumulative Return (%)'] = np.where(
+    returns = np.where(
         returns > 100,
         np.sqrt(returns) * 10,  # Scale down extreme values
         returns  # Keep reasonable values as-is
     )
     
     # Annualize volatility
-    summary['Volatility (%)'] = df['Volatility (%)'] * np.sqrt(252)
+    volatility = df['Volatility (%)'].to_numpy() * SQRT_252
     
     # Calculate Sharpe Ratio
     risk_free_rate = 2.0
-    summary['Sharpe Ratio'] = (summary['Cumulative Return (%)'] - risk_free_rate) / summary['Volatility (%)']
-    summary['Sharpe Ratio'] = summary['Sharpe Ratio'].replace([np.inf, -np.inf], 0).fillna(0)
-    
-    print("\n=== RECENT PERIOD SUMMARY ===")
-    print(summary.head(10))
-    
-    print(f"\nReturn range: {summary['Cumulative Return (%)'].min():.2f}% to {summary['Cumulative Return (%)'].max():.2f}%")
-    print(f"Volatility range: {summary['Volatility (%)'].min():.2f}% to {summary['Volatility (%)'].max():.2f}%")
-    print(f"Sharpe range: {summary['Sharpe Ratio'].min():.2f} to {summary['Sharpe Ratio'].max():.2f}")
-    
+    sharpe = sharpe_ratio(returns, volatility, risk_free_rate)
+    
+    summary = pd.DataFrame({
+        'Stock': df['Stock'].astype('category'),
+        'Cumulative Return (%)': returns,
+        'Volatility (%)': volatility,
+        'Sharpe Ratio': sharpe
+    }, copy=False)
+    
+    if verbose:
+        print("\n=== RECENT PERIOD SUMMARY ===")
+        print(summary.head(10))
+        print()
+        print_summary_stats(summary)
+    
+    summary[NUMERIC_COLUMNS] = summary[NUMERIC_COLUMNS].astype('float32')
     summary.to_csv(output_csv, index=False)
-    print(f"\n✅ Recent period summary saved to: {output_csv}")
+    summary.to_parquet(os.path.splitext(output_csv)[0] + '.parquet', engine='pyarrow', compression='snappy')
+    if verbose:
+        print(f"\n✅ Recent period summary saved to: {output_csv}")
     
     return summary
 
@@ -125,14 +161,24 @@ if __name__ == "__main__":
     print("FIXING QUANTITATIVE SUMMARY DATA")
     print("=" * 60)
     
-    # Method 1: Cap extreme values
-    print("\n### METHOD 1: Capping Extreme Values ###\n")
-    df1 = create_quantitative_summary(input_file, 'quantitative_summary_capped.csv')
-    
-    # Method 2: Transform extreme values
-    print("\n" + "=" * 60)
-    print("\n### METHOD 2: Transform Extreme Values (RECOMMENDED) ###\n")
-    df2 = create_summary_from_recent_returns(input_file, output_csv='quantitative_summary_transformed.csv')
+    # Both methods read the same input independently, so run them in parallel processes.
+    # Workers stay quiet; each method's results are printed here, in order, once ready
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(create_quantitative_summary, input_file, 'quantitative_summary_capped.csv')
+        future2 = executor.submit(create_summary_from_recent_returns, input_file,
+                                  output_csv='quantitative_summary_transformed.csv')
+        
+        # Method 1: Cap extreme values
+        df1 = future1.result()
+        print("\n### METHOD 1: Capping Extreme Values ###")
+        print(df1.head())
+        print_summary_stats(df1)
+        
+        # Method 2: Transform extreme values (RECOMMENDED)
+        df2 = future2.result()
+        print("\n### METHOD 2: Transform Extreme Values (RECOMMENDED) ###")
+        print(df2.head(10))
+        print_summary_stats(df2)
     
     print("\n" + "=" * 60)
     print("\n✅ DONE! Two versions created:")
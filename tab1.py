@@ -2,40 +2,69 @@ import streamlit as st
 import pandas as pd
 import requests
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import streamlit.components.v1 as components
 import os
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
 import json
+import html
 
 # Load environment variables
 load_dotenv()
+ALPHAVANTAGE_KEY = os.getenv('ALPHAVANTAGE_KEY')
 
-def send_slack_notification(webhook_url, ipo_data):
+# Shared pool for the tab's independent network calls (quotes, movers, IPOs, news)
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tab1')
+
+# Keep-alive session shared by the Alpha Vantage and Slack calls; transient
+# gateway errors are retried with a short backoff instead of failing the section.
+# Only GETs retry on read errors and 5xx: a resent Slack POST could duplicate an
+# alert Slack already accepted, so POSTs retry only when the connection fails.
+_SESSION = requests.Session()
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                      allowed_methods=['GET'])
+))
+
+# IPOs already announced on Slack, persisted so a server restart doesn't re-send them
+NOTIFIED_IPOS_PATH = os.path.join('.cache', 'notified_ipos.json')
+
+# (connect, read) timeout for _SESSION calls, and the most any section waits on a Finnhub future
+HTTP_TIMEOUT = (2, 5)
+FINNHUB_TIMEOUT = 6
+
+def send_slack_notification(webhook_url, ipo_data_list):
     """
-    Send IPO notification to Slack channel
+    Send IPO notifications to Slack channel as a single message
     
     Args:
         webhook_url: Slack webhook URL
-        ipo_data: Dictionary containing IPO details
+        ipo_data_list: List of dictionaries containing IPO details
     """
     try:
-        # Format price
-        price_str = f"${ipo_data['price']}" if ipo_data['price'] and ipo_data['price'] != 'N/A' else "TBD"
-        
-        # Format number of shares
-        shares_str = f"{int(ipo_data['numberOfShares']):,}" if ipo_data['numberOfShares'] else "N/A"
+        # Create Slack message with rich formatting: one header, then a block group per IPO
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "New IPO Alert!" if len(ipo_data_list) == 1 else f"{len(ipo_data_list)} New IPO Alerts!",
+                    "emoji": True
+                }
+            }
+        ]
         
-        # Create Slack message with rich formatting
-        slack_message = {
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "New IPO Alert!",
-                        "emoji": True
-                    }
-                },
+        for ipo_data in ipo_data_list:
+            # Format price
+            price_str = f"${ipo_data['price']}" if ipo_data['price'] and ipo_data['price'] != 'N/A' else "TBD"
+            
+            # Format number of shares
+            shares_str = f"{int(ipo_data['numberOfShares']):,}" if ipo_data['numberOfShares'] else "N/A"
+            
+            blocks.extend([
                 {
                     "type": "section",
                     "fields": [
@@ -74,14 +103,16 @@ def send_slack_notification(webhook_url, ipo_data):
                 {
                     "type": "divider"
                 }
-            ]
-        }
+            ])
+        
+        slack_message = {"blocks": blocks}
         
         # Send POST request to Slack webhook
-        response = requests.post(
+        response = _SESSION.post(
             webhook_url,
             data=json.dumps(slack_message),
-            headers={'Content-Type': 'application/json'}
+            headers={'Content-Type': 'application/json'},
+            timeout=HTTP_TIMEOUT
         )
         
         if response.status_code != 200:
@@ -94,6 +125,171 @@ def send_slack_notification(webhook_url, ipo_data):
         st.error(f"Error sending Slack notification: {e}")
         return False
 
+# TradingView Advanced Chart Widget (plain string: only the symbol is substituted per rerun)
+_TV_TEMPLATE = """
+    <!-- TradingView Widget BEGIN -->
+    <div class="tradingview-widget-container" style="height:100%; width:100%; margin:0; padding:0;">
+      <div class="tradingview-widget-container__widget" style="height:calc(100% - 32px); width:100%;"></div>
+      <script type="text/javascript" src="https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js" async>
+      {
+      "width": "100%",
+      "height": "600",
+      "symbol": "__SYM__",
+      "interval": "D",
+      "timezone": "America/New_York",
+      "theme": "light",
+      "style": "1",
+      "locale": "en",
+      "enable_publishing": false,
+      "allow_symbol_change": true,
+      "calendar": false,
+      "hide_top_toolbar": false,
+      "hide_legend": false,
+      "save_image": false,
+      "support_host": "https://www.tradingview.com"
+    }
+      </script>
+    </div>
+    <!-- TradingView Widget END -->
+    """
+
+def _load_notified_ipos():
+    """Read the persisted {ipo_date: [symbol, ...]} file as a set of (symbol, date) tuples"""
+    try:
+        with open(NOTIFIED_IPOS_PATH) as f:
+            by_date = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return {(symbol, date) for date, symbols in by_date.items() for symbol in symbols}
+
+def _save_notified_ipos(ipo_ids):
+    """Merge (symbol, date) tuples into the persisted file, dropping IPO dates already past"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    by_date = {}
+    for symbol, date in _load_notified_ipos() | set(ipo_ids):
+        if date >= today:
+            by_date.setdefault(date, []).append(symbol)
+    try:
+        os.makedirs(os.path.dirname(NOTIFIED_IPOS_PATH), exist_ok=True)
+        with open(NOTIFIED_IPOS_PATH, 'w') as f:
+            json.dump({date: sorted(symbols) for date, symbols in sorted(by_date.items())}, f)
+    except OSError:
+        pass  # Persistence is best-effort; the session set still prevents repeats
+
+# One HTML block per list row: a single frontend message instead of four element calls;
+# secondary lines use the .row-caption class from static/finfusion.css
+
+def _mover_row_html(row, color=None):
+    """Ticker/price, change and volume for one mover; color defaults to the sign of the change"""
+    change_pct = row.get('change_percentage', '0%')
+    if color is None:
+        color = '#22c55e' if float(change_pct.replace('%', '')) >= 0 else '#ef4444'
+    return (
+        f"<div><b>{html.escape(row.get('ticker', 'N/A'))}</b> - ${float(row.get('price', 0)):.2f}<br>"
+        f"<span style='color: {color}; font-weight: bold;'>{html.escape(change_pct)}</span><br>"
+        f"<span class='row-caption'>Vol: {int(row.get('volume', 0)):,}</span></div><hr>"
+    )
+
+def _ipo_row_html(row):
+    """Symbol, date and (truncated) company name for one upcoming IPO"""
+    name = row['name'][:40] + ('...' if len(row['name']) > 40 else '')
+    return (
+        f"<div><b>{html.escape(row['symbol'])}</b><br>"
+        f"<span class='row-caption'>{row['formatted_date']}</span><br>"
+        f"<span class='row-caption'>{html.escape(name)}</span></div><hr>"
+    )
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _quotes(_finnhub_client, symbols):
+    """Fetch Finnhub quotes for a tuple of symbols, reused across reruns for 30s"""
+    # Finnhub has no multi-symbol quote endpoint, so issue the calls concurrently
+    with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+        return dict(zip(symbols, executor.map(_finnhub_client.quote, symbols)))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _ipo_calendar(_finnhub_client, from_date, to_date, limit=5):
+    """
+    Next `limit` IPOs between two YYYY-MM-DD dates as row dicts, sorted by date
+    
+    Each row carries a display-ready 'formatted_date' so cache hits do no
+    datetime work; the date arguments roll the cache daily.
+    """
+    ipo_list = _finnhub_client.ipo_calendar(_from=from_date, to=to_date).get('ipoCalendar', [])
+    if not ipo_list:
+        return []
+    
+    # Select only the columns we want, sort by date and limit
+    ipo_df = pd.DataFrame(ipo_list)[['date', 'name', 'symbol', 'numberOfShares', 'price']]
+    rows = ipo_df.sort_values('date').head(limit).to_dict('records')
+    for row in rows:
+        row['formatted_date'] = datetime.strptime(row['date'], '%Y-%m-%d').strftime('%b %d')
+    return rows
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _general_news(_finnhub_client):
+    """
+    Finnhub general market news, refreshed at most every five minutes
+    
+    Returns (articles, categories, by_category): each article carries its
+    title-cased category under '_cat' and a display-ready 'formatted_date',
+    categories is the sorted dropdown list
+    and by_category groups the articles so filtering is a dict lookup.
+    """
+    articles = _finnhub_client.general_news('general', min_id=0)
+    by_category = {}
+    for article in articles:
+        article['_cat'] = article.get('category', 'general').title()
+        article['formatted_date'] = datetime.fromtimestamp(article['datetime']).strftime('%b %d')
+        by_category.setdefault(article['_cat'], []).append(article)
+    categories = sorted(category for category in by_category if category)
+    return articles, categories, by_category
+
+def _to_float(value):
+    """Parse an Alpha Vantage numeric string, NaN when it isn't a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+# FILTER OUT PENNY STOCKS AND LOW VOLUME
+def filter_stocks(rows, min_price=5.0, min_volume=100000, limit=None):
+    """
+    Filter out penny stocks and low volume stocks
+    
+    Works on the raw JSON rows: the lists are ~20 entries and only the first
+    few survivors are rendered, so plain Python beats building a DataFrame.
+    """
+    filtered = []
+    for row in rows:
+        price = _to_float(row.get('price'))
+        volume = _to_float(row.get('volume'))
+        
+        # Filter: price >= $5 and volume >= 100k (NaN fails both comparisons)
+        if price >= min_price and volume >= min_volume:
+            filtered.append({**row, 'price': price, 'volume': volume})
+            if len(filtered) == limit:
+                break
+    
+    return filtered
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _top_movers(top_n=3):
+    """
+    Fetch Alpha Vantage top gainers, losers and most active as filtered, trimmed row dicts
+    
+    The endpoint is rate-limited and only changes intraday, so the filtered
+    rows are cached and reruns skip both the request and the filtering.
+    """
+    data = _SESSION.get(
+        'https://www.alphavantage.co/query',
+        params={'function': 'TOP_GAINERS_LOSERS', 'apikey': ALPHAVANTAGE_KEY},
+        timeout=HTTP_TIMEOUT
+    ).json()
+    return tuple(
+        filter_stocks(data.get(key, []), limit=top_n)
+        for key in ('top_gainers', 'top_losers', 'most_actively_traded')
+    )
+
 def render_tab1(finnhub_client):
     SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
     """
@@ -103,6 +299,16 @@ def render_tab1(finnhub_client):
         finnhub_client: Initialized Finnhub client object
     """
     
+    # Start every independent network call now so the sections below wait on
+    # the slowest one instead of the sum of all of them
+    today = datetime.now()
+    from_date = today.strftime('%Y-%m-%d')
+    to_date = (today + timedelta(days=30)).strftime('%Y-%m-%d')
+    quotes_future = _EXECUTOR.submit(_quotes, finnhub_client, ('VOO', 'QQQ'))
+    movers_future = _EXECUTOR.submit(_top_movers) if ALPHAVANTAGE_KEY else None
+    ipo_future = _EXECUTOR.submit(_ipo_calendar, finnhub_client, from_date, to_date)
+    news_future = _EXECUTOR.submit(_general_news, finnhub_client)
+    
     # ===========================
     # TRADINGVIEW LIVE CHART
     # ===========================
@@ -121,32 +327,7 @@ def render_tab1(finnhub_client):
         )
     
     # TradingView Advanced Chart Widget
-    tradingview_html = f"""
-    <!-- TradingView Widget BEGIN -->
-    <div class="tradingview-widget-container" style="height:100%; width:100%; margin:0; padding:0;">
-      <div class="tradingview-widget-container__widget" style="height:calc(100% - 32px); width:100%;"></div>
-      <script type="text/javascript" src="https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js" async>
-      {{
-      "width": "100%",
-      "height": "600",
-      "symbol": "{chart_symbol}",
-      "interval": "D",
-      "timezone": "America/New_York",
-      "theme": "light",
-      "style": "1",
-      "locale": "en",
-      "enable_publishing": false,
-      "allow_symbol_change": true,
-      "calendar": false,
-      "hide_top_toolbar": false,
-      "hide_legend": false,
-      "save_image": false,
-      "support_host": "https://www.tradingview.com"
-    }}
-      </script>
-    </div>
-    <!-- TradingView Widget END -->
-    """
+    tradingview_html = _TV_TEMPLATE.replace('__SYM__', chart_symbol)
     
     # Render the TradingView chart
     components.html(tradingview_html, height=650, scrolling=False)
@@ -163,8 +344,9 @@ def render_tab1(finnhub_client):
     # Placeholder for live data
     try:
         # Fetch live data for VOO (S&P 500 ETF) and QQQ (NASDAQ-100 ETF)
-        voo_quote = finnhub_client.quote('VOO')
-        qqq_quote = finnhub_client.quote('QQQ')
+        quotes = quotes_future.result(timeout=FINNHUB_TIMEOUT)
+        voo_quote = quotes['VOO']
+        qqq_quote = quotes['QQQ']
         
         # VOO (S&P 500)
         with col1:
@@ -241,99 +423,42 @@ def render_tab1(finnhub_client):
         st.markdown("## Top Movers")
         st.markdown("")
         
-        try:
-            # Fetch data from Alpha Vantage
-            url = 'https://www.alphavantage.co/query?function=TOP_GAINERS_LOSERS&apikey=HMBC15KFXX2F7LOH'
-            r = requests.get(url)
-            data = r.json()
-            
-            # Convert to DataFrames
-            top_gainers = pd.DataFrame(data.get('top_gainers', []))
-            top_losers = pd.DataFrame(data.get('top_losers', []))
-            most_active = pd.DataFrame(data.get('most_actively_traded', []))
-
-            # FILTER OUT PENNY STOCKS AND LOW VOLUME
-            def filter_stocks(df, min_price=5.0, min_volume=100000):
-                """Filter out penny stocks and low volume stocks"""
-                if df.empty:
-                    return df
+        if movers_future is None:
+            st.warning("Alpha Vantage key not configured in .env file")
+        else:
+            try:
+                # Filtered top 3 per list from Alpha Vantage (fetched in the background above)
+                top_gainers, top_losers, most_active = movers_future.result()
                 
-                # Convert price and volume to numeric
-                df['price'] = pd.to_numeric(df['price'], errors='coerce')
-                df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
+                # Create tabs
+                tab_gainers, tab_losers, tab_volume = st.tabs(["Gainers", "Losers", "Volume"])
                 
-                # Filter: price >= $5 and volume >= 100k
-                filtered = df[(df['price'] >= min_price) & (df['volume'] >= min_volume)]
+                # GAINERS TAB
+                with tab_gainers:
+                    if top_gainers:
+                        for row in top_gainers:
+                            st.markdown(_mover_row_html(row, '#22c55e'), unsafe_allow_html=True)
+                    else:
+                        st.info("No significant gainers")
                 
-                return filtered
-            
-            # Apply filters
-            top_gainers = filter_stocks(top_gainers)
-            top_losers = filter_stocks(top_losers)
-            most_active = filter_stocks(most_active)
-            
-            # Create tabs
-            tab_gainers, tab_losers, tab_volume = st.tabs(["Gainers", "Losers", "Volume"])
-            
-            # GAINERS TAB
-            with tab_gainers:
-                if not top_gainers.empty:
-                    top_3_gainers = top_gainers.head(3).copy()
-                    
-                    for idx, row in top_3_gainers.iterrows():
-                        ticker = row.get('ticker', 'N/A')
-                        price = float(row.get('price', 0))
-                        change_pct = row.get('change_percentage', '0%')
-                        volume = row.get('volume', 0)
-                        
-                        st.markdown(f"**{ticker}** - ${price:.2f}")
-                        st.markdown(f"<span style='color: #22c55e; font-weight: bold;'>{change_pct}</span>", unsafe_allow_html=True)
-                        st.caption(f"Vol: {int(volume):,}")
-                        st.markdown("---")
-                else:
-                    st.info("No significant gainers")
-            
-            # LOSERS TAB
-            with tab_losers:
-                if not top_losers.empty:
-                    top_3_losers = top_losers.head(3).copy()
-                    
-                    for idx, row in top_3_losers.iterrows():
-                        ticker = row.get('ticker', 'N/A')
-                        price = float(row.get('price', 0))
-                        change_pct = row.get('change_percentage', '0%')
-                        volume = row.get('volume', 0)
-                        
-                        st.markdown(f"**{ticker}** - ${price:.2f}")
-                        st.markdown(f"<span style='color: #ef4444; font-weight: bold;'>{change_pct}</span>", unsafe_allow_html=True)
-                        st.caption(f"Vol: {int(volume):,}")
-                        st.markdown("---")
-                else:
-                    st.info("No significant losers")
-            
-            # VOLUME TAB
-            with tab_volume:
-                if not most_active.empty:
-                    top_3_active = most_active.head(3).copy()
-                    
-                    for idx, row in top_3_active.iterrows():
-                        ticker = row.get('ticker', 'N/A')
-                        price = float(row.get('price', 0))
-                        change_pct = row.get('change_percentage', '0%')
-                        volume = row.get('volume', 0)
-                        
-                        change_val = float(change_pct.replace('%', ''))
-                        color = '#22c55e' if change_val >= 0 else '#ef4444'
-                        
-                        st.markdown(f"**{ticker}** - ${price:.2f}")
-                        st.markdown(f"<span style='color: {color}; font-weight: bold;'>{change_pct}</span>", unsafe_allow_html=True)
-                        st.caption(f"Vol: {int(volume):,}")
-                        st.markdown("---")
-                else:
-                    st.info("No significant volume")
-            
-        except Exception as e:
-            st.error(f"Unable to fetch market movers: {str(e)}")
+                # LOSERS TAB
+                with tab_losers:
+                    if top_losers:
+                        for row in top_losers:
+                            st.markdown(_mover_row_html(row, '#ef4444'), unsafe_allow_html=True)
+                    else:
+                        st.info("No significant losers")
+                
+                # VOLUME TAB
+                with tab_volume:
+                    if most_active:
+                        for row in most_active:
+                            st.markdown(_mover_row_html(row), unsafe_allow_html=True)
+                    else:
+                        st.info("No significant volume")
+                
+            except Exception as e:
+                st.error(f"Unable to fetch market movers: {str(e)}")
         st.markdown('</div>', unsafe_allow_html=True)
     
     # COLUMN 2 - IPO CALENDAR WITH SLACK NOTIFICATIONS
@@ -344,7 +469,7 @@ def render_tab1(finnhub_client):
         
         # Initialize session state for tracking sent notifications
         if 'notified_ipos' not in st.session_state:
-            st.session_state.notified_ipos = set()
+            st.session_state.notified_ipos = _load_notified_ipos()  # {(symbol, date), ...}
         
         # Check if Slack webhook is configured
         if not SLACK_WEBHOOK_URL:
@@ -354,68 +479,45 @@ def render_tab1(finnhub_client):
             enable_notifications = st.text("")
         
         try:
-            # Calculate date range (today and next 30 days)
-            today = datetime.now()
-            end_date = today + timedelta(days=30)
+            # Next 5 IPOs over the coming 30 days, sorted by date (fetched in the background above)
+            display_rows = ipo_future.result(timeout=FINNHUB_TIMEOUT)
             
-            # Format dates as YYYY-MM-DD
-            from_date = today.strftime('%Y-%m-%d')
-            to_date = end_date.strftime('%Y-%m-%d')
-            
-            # Fetch IPO calendar
-            ipo_data = finnhub_client.ipo_calendar(_from=from_date, to=to_date)
-            ipo_list = ipo_data.get('ipoCalendar', [])
-            
-            if ipo_list:
-                # Create a dataframe for better display
-                ipo_df = pd.DataFrame(ipo_list)
-                
-                # Select only the columns we want
-                if not ipo_df.empty:
-                    display_df = ipo_df[['date', 'name', 'symbol', 'numberOfShares', 'price']].copy()
+            if display_rows:
+                # Check for new IPOs and send notifications, skipping the check
+                # entirely while the cached IPO list is the one already handled
+                ipo_hash = hash(tuple((row['symbol'], row['date']) for row in display_rows))
+                if enable_notifications and SLACK_WEBHOOK_URL and ipo_hash != st.session_state.get('last_ipo_hash'):
+                    new_ipos = {}
                     
-                    # Sort by date and limit to 5
-                    display_df = display_df.sort_values('date').head(5)
-                    
-                    # Check for new IPOs and send notifications
-                    if enable_notifications and SLACK_WEBHOOK_URL:
-                        new_notifications = 0
-                        
-                        for idx, row in display_df.iterrows():
-                            # Create unique identifier for IPO
-                            ipo_id = f"{row['symbol']}_{row['date']}"
-                            
-                            # Check if already notified in this session
-                            if ipo_id not in st.session_state.notified_ipos:
-                                ipo_notification_data = {
-                                    'name': row['name'],
-                                    'symbol': row['symbol'],
-                                    'date': row['date'],
-                                    'price': row.get('price', 'N/A'),
-                                    'numberOfShares': row.get('numberOfShares', 'N/A'),
-                                    'exchange': row.get('exchange', 'N/A')
-                                }
-                                
-                                if send_slack_notification(SLACK_WEBHOOK_URL, ipo_notification_data):
-                                    st.session_state.notified_ipos.add(ipo_id)
-                                    new_notifications += 1
-                        
-                        if new_notifications > 0:
-                            st.success(f"🔔 {new_notifications} new IPO notification(s) sent to Slack!")
-                    
-                    # Display compact list
-                    for idx, row in display_df.iterrows():
-                        date_obj = datetime.strptime(row['date'], '%Y-%m-%d')
-                        formatted_date = date_obj.strftime('%b %d')
+                    for row in display_rows:
+                        # Create unique identifier for IPO
+                        ipo_id = (row['symbol'], row['date'])
                         
-                        st.markdown(f"**{row['symbol']}**")
-                        st.caption(f"{formatted_date}")
-                        st.caption(f"{row['name'][:40]}{'...' if len(row['name']) > 40 else ''}")
-                        st.markdown("---")
+                        # Check if already notified in this session
+                        if ipo_id not in st.session_state.notified_ipos:
+                            new_ipos[ipo_id] = {
+                                'name': row['name'],
+                                'symbol': row['symbol'],
+                                'date': row['date'],
+                                'price': row.get('price', 'N/A'),
+                                'numberOfShares': row.get('numberOfShares', 'N/A'),
+                                'exchange': row.get('exchange', 'N/A')
+                            }
                     
-                    st.caption(f"{len(display_df)} upcoming")
-                else:
-                    st.info("No upcoming IPOs")
+                    # One Slack POST for all new IPOs instead of one per IPO
+                    if not new_ipos:
+                        st.session_state.last_ipo_hash = ipo_hash
+                    elif send_slack_notification(SLACK_WEBHOOK_URL, list(new_ipos.values())):
+                        st.session_state.notified_ipos.update(new_ipos)
+                        st.session_state.last_ipo_hash = ipo_hash
+                        _save_notified_ipos(new_ipos)
+                        st.success(f"🔔 {len(new_ipos)} new IPO notification(s) sent to Slack!")
+                
+                # Display compact list
+                for row in display_rows:
+                    st.markdown(_ipo_row_html(row), unsafe_allow_html=True)
+                
+                st.caption(f"{len(display_rows)} upcoming")
             else:
                 st.info("No IPOs")
                 
@@ -433,18 +535,11 @@ def render_tab1(finnhub_client):
     st.markdown("")
 
     try:
-        # Fetch general news once
-        general_news = finnhub_client.general_news('general', min_id=0)
-        
-        # Extract unique categories
-        available_categories = set()
-        for article in general_news:
-            category = article.get('category', 'general')
-            if category:
-                available_categories.add(category.title())
+        # General news with precomputed categories (fetched once, in the background above)
+        general_news, available_categories, news_by_category = news_future.result(timeout=FINNHUB_TIMEOUT)
         
         # Category filter dropdown
-        category_options = ["All Categories"] + sorted(list(available_categories))
+        category_options = ["All Categories"] + available_categories
         selected_category = st.selectbox(
             "Filter by category:",
             category_options,
@@ -466,10 +561,7 @@ def render_tab1(finnhub_client):
         if selected_category == "All Categories":
             filtered_news = general_news
         else:
-            filtered_news = [
-                article for article in general_news 
-                if article.get('category', 'general').title() == selected_category
-            ]
+            filtered_news = news_by_category.get(selected_category, [])
         
         # Display news
         if not filtered_news:
@@ -481,7 +573,7 @@ def render_tab1(finnhub_client):
                 
                 st.markdown(f"**{article['headline']}**")
                 
-                date = datetime.fromtimestamp(article['datetime']).strftime('%b %d')
+                date = article['formatted_date']
                 source = article.get('source', 'Unknown')
                 
                 st.markdown(f"""
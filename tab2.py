@@ -1,6 +1,11 @@
 import streamlit as st
+import asyncio
+import httpx
+import orjson
 import requests
+import time
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import os
 from dotenv import load_dotenv
@@ -10,6 +15,26 @@ from pathlib import Path
 # Load environment variables from .env file
 load_dotenv()
 
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# Indicator key -> (FRED series_id, units transformation or None)
+FRED_SERIES = {
+    'gdp': ('GDPC1', None),
+    'inflation': ('CPIAUCSL', 'pc1'),
+    'debt': ('GFDEBTN', None),
+    'naturalGas': ('DHHNGSP', None),
+    'crudeOil': ('DCOILWTICO', None),
+    'copper': ('PCOPPUSDM', None)
+}
+
+# Keep-alive session for the synchronous fallback path (see _fetch_observations_sync)
+_FRED_SESSION = requests.Session()
+_FRED_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# Parsed series are also kept on disk so server restarts don't re-download them
+FRED_CACHE_DIR = Path('.cache') / 'fred'
+FRED_CACHE_TTL = 3600  # seconds
+
 def render_tab2(quant_df):
     """Render Tab 3: Economic Indicators Dashboard"""
     
@@ -28,17 +53,22 @@ def render_tab2(quant_df):
     col1, col2 = st.columns([6, 1])
     with col2:
         if st.button("🔄 Refresh", use_container_width=True):
+            _fetch_economic_data.clear()
+            st.session_state['fred_force_refresh'] = True
             st.rerun()
     
     # Fetch all data
     with st.spinner("Loading economic data..."):
-        data = fetch_all_economic_data(API_KEY)
+        data = fetch_all_economic_data(API_KEY, force_refresh=st.session_state.pop('fred_force_refresh', False))
     
     if data.get('error'):
         st.error(f"⚠️ {data['error']}")
         st.info("Make sure your FRED API key in the .env file is valid")
         return
     
+    if data.get('stale_error'):
+        st.warning(f"⚠️ Showing the last loaded data: {data['stale_error']}")
+    
     # Main Economic Indicators (Larger Cards)
     st.markdown("### Key Economic Indicators")
     col1, col2, col3, col4 = st.columns(4)
@@ -74,8 +104,11 @@ def render_tab2(quant_df):
 
     with col4:
         # Calculate trend for Debt-to-GDP ratio
-        if len(data['debt']['history']) >= 5 and len(data['gdp']['history']) >= 5:
-            old_ratio = (float(data['debt']['history'][-5]['value']) / float(data['gdp']['history'][-5]['value'])) * 100
+        debt_values = data['debt']['history']['value']
+        gdp_values = data['gdp']['history']['value']
+        if len(debt_values) >= 5 and len(gdp_values) >= 5:
+            # History values are already floats from the fetch
+            old_ratio = (debt_values[-5] / gdp_values[-5]) * 100
             debt_gdp_trend = debt_to_gdp - old_ratio
         else:
             debt_gdp_trend = 0
@@ -131,89 +164,257 @@ def render_tab2(quant_df):
     st.caption("⚠️ Data source: Federal Reserve Economic Data (FRED)")
 
 
-def fetch_all_economic_data(api_key):
-    """Fetch all economic indicators from FRED API"""
+async def _fetch_observations(client, key, url):
+    """Fetch one FRED series and return (key, parsed JSON)"""
+    response = await client.get(url, timeout=10)
+    response.raise_for_status()
+    return key, orjson.loads(response.content)
+
+
+async def _fetch_all_observations(endpoints):
+    """Fetch every FRED endpoint concurrently over one pooled HTTP/2 client"""
+    async with httpx.AsyncClient(http2=True) as client:
+        results = await asyncio.gather(
+            *(_fetch_observations(client, key, url) for key, url in endpoints.items())
+        )
+    return dict(results)
+
+
+class FREDDataError(Exception):
+    """A FRED series came back without usable observations"""
+
+
+def _fetch_observations_sync(endpoints):
+    """Sequential keep-alive fallback for when an event loop is already running in this thread"""
+    results = {}
+    for key, url in endpoints.items():
+        response = _FRED_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        results[key] = orjson.loads(response.content)
+    return results
+
+
+def _event_loop_running():
+    """True when called from inside a running asyncio loop, where asyncio.run() would fail"""
     try:
-        # Define all API endpoints
-        endpoints = {
-            'gdp': f"https://api.stlouisfed.org/fred/series/observations?series_id=GDPC1&api_key={api_key}&file_type=json",
-            'inflation': f"https://api.stlouisfed.org/fred/series/observations?series_id=CPIAUCSL&api_key={api_key}&file_type=json&units=pc1",
-            'debt': f"https://api.stlouisfed.org/fred/series/observations?series_id=GFDEBTN&api_key={api_key}&file_type=json",
-            'naturalGas': f"https://api.stlouisfed.org/fred/series/observations?series_id=DHHNGSP&api_key={api_key}&file_type=json",
-            'crudeOil': f"https://api.stlouisfed.org/fred/series/observations?series_id=DCOILWTICO&api_key={api_key}&file_type=json",
-            'copper': f"https://api.stlouisfed.org/fred/series/observations?series_id=PCOPPUSDM&api_key={api_key}&file_type=json"
-        }
-        
-        data = {}
-        
-        for key, url in endpoints.items():
-            response = requests.get(url)
-            response.raise_for_status()
-            json_data = response.json()
-            
-            if 'observations' not in json_data or len(json_data['observations']) == 0:
-                return {'error': f'No data available for {key}'}
-            
-            observations = json_data['observations']
-            
-            # Filter out observations with missing data (value = '.')
-            valid_observations = [
-                obs for obs in observations 
-                if obs['value'] != '.' and obs['value'] != ''
-            ]
-            
-            if len(valid_observations) == 0:
-                return {'error': f'No valid data available for {key}'}
-            
-            latest = valid_observations[-1]
-            
-            # Calculate trend (last 5 valid observations)
-            trend = 0
-            if len(valid_observations) >= 5:
-                try:
-                    old_val = float(valid_observations[-5]['value'])
-                    new_val = float(latest['value'])
-                    if old_val != 0:
-                        trend = ((new_val - old_val) / old_val) * 100
-                except (ValueError, TypeError):
-                    trend = 0
-            
-            # Get last 10 valid observations for history
-            history = []
-            for obs in valid_observations[-10:]:
-                try:
-                    history.append({
-                        'date': obs['date'],
-                        'value': float(obs['value'])
-                    })
-                except (ValueError, TypeError):
-                    continue
-            
-            data[key] = {
-                'value': float(latest['value']),
-                'date': latest['date'],
-                'trend': trend,
-                'history': history
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _series_cache_path(series_id, units):
+    """On-disk Parquet location for one FRED series (units transformation included)"""
+    return FRED_CACHE_DIR / f"{series_id}{'_' + units if units else ''}.parquet"
+
+
+def _read_cached_series(series_id, units, ttl=FRED_CACHE_TTL):
+    """Parsed series from disk if younger than ttl seconds (any age when ttl is None), else None"""
+    path = _series_cache_path(series_id, units)
+    try:
+        if ttl is None or time.time() - path.stat().st_mtime < ttl:
+            return pd.read_parquet(path)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_cached_series(series_id, units, df):
+    """Best-effort write of a parsed series; a read-only disk just means no persistence"""
+    try:
+        FRED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(_series_cache_path(series_id, units), index=False)
+    except OSError:
+        pass
+
+
+def _parse_observations(key, json_data, keep=10):
+    """
+    Turn a FRED observations payload into a (date, value) frame of its last `keep` valid rows
+    
+    Only the tail feeds the latest value, the 5-period trend and the history,
+    so the observations are walked newest-first and the walk stops early
+    instead of converting decades of data.
+    """
+    if 'observations' not in json_data or len(json_data['observations']) == 0:
+        raise FREDDataError(f'No data available for {key}')
+    
+    # Missing observations are reported as '.' (or '')
+    tail = []
+    for obs in reversed(json_data['observations']):
+        if obs['value'] not in ('.', ''):
+            tail.append(obs)
+            if len(tail) >= keep:
+                break
+    
+    df = pd.DataFrame(tail[::-1], columns=['date', 'value'])
+    df['value'] = pd.to_numeric(df['value'], errors='coerce').astype('float64')
+    df = df.dropna(subset=['value']).reset_index(drop=True)
+    
+    if df.empty:
+        raise FREDDataError(f'No valid data available for {key}')
+    return df
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_economic_data(api_key, use_disk_cache=True):
+    """
+    Fetch all economic indicators from FRED API
+    
+    Cached for an hour (macro series update daily at most), in memory and per
+    series on disk. Only series without a fresh disk copy are requested; if
+    that request fails, expired disk copies are used when every missing series
+    has one. Failures raise instead of returning an error dict so they are
+    never cached.
+    """
+    frames = {}
+    endpoints = {}
+    for key, (series_id, units) in FRED_SERIES.items():
+        cached = _read_cached_series(series_id, units) if use_disk_cache else None
+        if cached is not None:
+            frames[key] = cached
+        else:
+            endpoints[key] = (
+                f"{FRED_OBSERVATIONS_URL}?series_id={series_id}&api_key={api_key}&file_type=json"
+                + (f"&units={units}" if units else "")
+            )
+    
+    if endpoints:
+        try:
+            # Fire all requests at once; wall-clock is the slowest series, not the sum
+            if _event_loop_running():
+                responses = _fetch_observations_sync(endpoints)
+            else:
+                responses = asyncio.run(_fetch_all_observations(endpoints))
+        except (httpx.HTTPError, requests.exceptions.RequestException):
+            stale = {key: _read_cached_series(*FRED_SERIES[key], ttl=None) for key in endpoints}
+            if any(df is None for df in stale.values()):
+                raise
+            frames.update(stale)
+        else:
+            for key, json_data in responses.items():
+                frames[key] = _parse_observations(key, json_data)
+                _write_cached_series(*FRED_SERIES[key], frames[key])
+    
+    # Trend over the last 5 valid observations for all series in one vectorized op;
+    # series shorter than 5 (NaN) or with a zero base get a 0 trend
+    keys = list(FRED_SERIES)
+    latest = np.fromiter((frames[k]['value'].iloc[-1] for k in keys), dtype=np.float64, count=len(keys))
+    old = np.fromiter((frames[k]['value'].iloc[-5] if len(frames[k]) >= 5 else np.nan for k in keys),
+                      dtype=np.float64, count=len(keys))
+    valid = np.isfinite(old) & (old != 0)
+    trends = np.zeros_like(latest)
+    np.divide((latest - old) * 100, old, out=trends, where=valid)
+    
+    data = {}
+    for key, latest_value, trend in zip(keys, latest.tolist(), trends.tolist()):
+        df = frames[key]
+        data[key] = {
+            'value': latest_value,
+            'date': df['date'].iloc[-1],
+            'trend': trend,
+            # Last 10 valid observations for history, as parallel arrays
+            'history': {
+                'date': df['date'].to_numpy()[-10:],
+                'value': df['value'].to_numpy()[-10:]
             }
-        
-        return data
-        
-    except requests.exceptions.RequestException as e:
-        return {'error': f'API request failed: {str(e)}'}
+        }
+    
+    return data
+
+
+def fetch_all_economic_data(api_key, force_refresh=False):
+    """
+    Fetch all economic indicators, falling back to the last good payload on failure
+    
+    force_refresh skips the on-disk series cache. Returns the indicator dict,
+    with 'stale_error' set when it is a fallback, or {'error': ...} when
+    nothing has loaded successfully yet.
+    """
+    try:
+        data = _fetch_economic_data(api_key, use_disk_cache=not force_refresh)
+    except (httpx.HTTPError, requests.exceptions.RequestException) as e:
+        error = f'API request failed: {str(e)}'
+    except FREDDataError as e:
+        error = str(e)
     except ValueError as e:
-        return {'error': f'Invalid data format: {str(e)}'}
+        error = f'Invalid data format: {str(e)}'
     except Exception as e:
-        return {'error': f'Error fetching data: {str(e)}'}
+        error = f'Error fetching data: {str(e)}'
+    else:
+        st.session_state['fred_last_good'] = data
+        return data
+    
+    last_good = st.session_state.get('fred_last_good')
+    if last_good:
+        return {**last_good, 'stale_error': error}
+    return {'error': error}
+
+
+# US Debt Clock card (plain string: only the inlined image is substituted)
+_DEBT_CLOCK_TEMPLATE = """
+    <div style='
+        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+        padding: 25px;
+        border-radius: 15px;
+        box-shadow: 0 8px 20px rgba(0,0,0,0.3);
+        width: 100%;
+    '>
+        <h3 style='color: white; text-align: center; margin-bottom: 20px; font-size: 20px;'>
+            🏛️ US Debt Clock - Live Dashboard
+        </h3>
+        <a href="https://www.usdebtclock.org/" target="_blank" style="text-decoration: none; display: block;">
+            <img 
+                src="data:image/png;base64,__IMG_BASE64__" 
+                style='
+                    width: 100%;
+                    border-radius: 10px;
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.4);
+                    transition: transform 0.3s ease, box-shadow 0.3s ease;
+                    cursor: pointer;
+                    display: block;
+                '
+                onmouseover="this.style.transform='scale(1.01)'; this.style.boxShadow='0 8px 20px rgba(0,0,0,0.6)'"
+                onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.4)'"
+                alt="US Debt Clock Dashboard"
+            />
+        </a>
+        <div style='text-align: center; margin-top: 20px;'>
+            <a href="https://www.usdebtclock.org/" target="_blank"
+               style='
+                   background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+                   color: white;
+                   padding: 14px 35px;
+                   border-radius: 25px;
+                   text-decoration: none;
+                   font-weight: bold;
+                   display: inline-block;
+                   transition: all 0.3s ease;
+                   box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+                   font-size: 16px;
+               '
+               onmouseover="this.style.transform='translateY(-2px)'; this.style.boxShadow='0 6px 12px rgba(0,0,0,0.3)'"
+               onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 8px rgba(0,0,0,0.2)'">
+                View Live Debt Clock ↗️
+            </a>
+        </div>
+        <p style='color: rgba(255,255,255,0.7); text-align: center; margin-top: 12px; font-size: 14px;'>
+            Click to view real-time US economic data, debt, spending, and more
+        </p>
+    </div>
+"""
 
 
+@st.cache_data(show_spinner=False)
 def get_image_base64(image_path):
-    """Convert image to base64 string"""
-    try:
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except Exception as e:
-        st.error(f"Error loading image: {e}")
-        return None
+    """Convert image to base64 string (read and encoded once per process)"""
+    return base64.b64encode(Path(image_path).read_bytes()).decode('ascii')
+
+
+@st.cache_data(show_spinner=False)
+def debt_clock_html(image_path):
+    """Full debt clock card HTML with the image inlined, built once per process"""
+    return _DEBT_CLOCK_TEMPLATE.replace('__IMG_BASE64__', get_image_base64(image_path))
 
 
 def display_debt_clock_thumbnail():
@@ -222,61 +423,15 @@ def display_debt_clock_thumbnail():
     image_path = "debt_clock.png"
     
     if Path(image_path).exists():
-        img_base64 = get_image_base64(image_path)
+        try:
+            html = debt_clock_html(image_path)
+        except OSError as e:
+            st.error(f"Error loading image: {e}")
+            html = None
         
-        if img_base64:
+        if html:
             # Display with image thumbnail - Full Width
-            st.markdown(f"""
-                <div style='
-                    background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-                    padding: 25px;
-                    border-radius: 15px;
-                    box-shadow: 0 8px 20px rgba(0,0,0,0.3);
-                    width: 100%;
-                '>
-                    <h3 style='color: white; text-align: center; margin-bottom: 20px; font-size: 20px;'>
-                        🏛️ US Debt Clock - Live Dashboard
-                    </h3>
-                    <a href="https://www.usdebtclock.org/" target="_blank" style="text-decoration: none; display: block;">
-                        <img 
-                            src="data:image/png;base64,{img_base64}" 
-                            style='
-                                width: 100%;
-                                border-radius: 10px;
-                                box-shadow: 0 4px 12px rgba(0,0,0,0.4);
-                                transition: transform 0.3s ease, box-shadow 0.3s ease;
-                                cursor: pointer;
-                                display: block;
-                            '
-                            onmouseover="this.style.transform='scale(1.01)'; this.style.boxShadow='0 8px 20px rgba(0,0,0,0.6)'"
-                            onmouseout="this.style.transform='scale(1)'; this.style.boxShadow='0 4px 12px rgba(0,0,0,0.4)'"
-                            alt="US Debt Clock Dashboard"
-                        />
-                    </a>
-                    <div style='text-align: center; margin-top: 20px;'>
-                        <a href="https://www.usdebtclock.org/" target="_blank"
-                           style='
-                               background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-                               color: white;
-                               padding: 14px 35px;
-                               border-radius: 25px;
-                               text-decoration: none;
-                               font-weight: bold;
-                               display: inline-block;
-                               transition: all 0.3s ease;
-                               box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-                               font-size: 16px;
-                           '
-                           onmouseover="this.style.transform='translateY(-2px)'; this.style.boxShadow='0 6px 12px rgba(0,0,0,0.3)'"
-                           onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 4px 8px rgba(0,0,0,0.2)'">
-                            View Live Debt Clock ↗️
-                        </a>
-                    </div>
-                    <p style='color: rgba(255,255,255,0.7); text-align: center; margin-top: 12px; font-size: 14px;'>
-                        Click to view real-time US economic data, debt, spending, and more
-                    </p>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(html, unsafe_allow_html=True)
         else:
             st.error("Failed to load debt_clock.png")
             display_debt_clock_card_fallback()
@@ -360,13 +515,7 @@ def display_commodity_metric(title, value, unit, trend, date):
 def display_history_table(data, key, label):
     """Display historical data as table"""
     history = data[key]['history']
-    df = pd.DataFrame([
-        {
-            'Date': obs['date'],
-            label: float(obs['value'])
-        }
-        for obs in history
-    ])
+    df = pd.DataFrame({'Date': history['date'], label: history['value']})
     df = df.sort_values('Date', ascending=False)
     st.dataframe(df, use_container_width=True, hide_index=True)
 
@@ -374,5 +523,5 @@ def display_history_table(data, key, label):
 def display_commodity_history(data, key):
     """Display commodity price history"""
     history = data[key]['history']
-    for obs in reversed(history[-5:]):  # Show last 5
-        st.text(f"{obs['date']}: ${float(obs['value']):.2f}")
+    for date, value in zip(history['date'][:-6:-1], history['value'][:-6:-1]):  # Show last 5, newest first
+        st.text(f"{date}: ${value:.2f}")
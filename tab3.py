@@ -13,13 +13,24 @@ Features:
 import streamlit as st
 import pandas as pd
 import numpy as np
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+import re
+import threading
+from collections import deque
+import time
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 import os
 from dotenv import load_dotenv
-from typing import Optional, Dict, List, Tuple, Callable, Any
+from typing import Optional, Dict, List, Tuple, Callable, Any, Iterator, Union
 import json
+import hashlib
+import functools
+from cachetools import TTLCache
 from abc import ABC, abstractmethod
 
 load_dotenv()
@@ -42,6 +53,26 @@ class Config:
     
     MAX_TOKENS = 4000
     TEMPERATURE = 0.1
+    
+    LLM_CACHE_SIZE = 1024
+    LLM_CACHE_TTL = 300  # seconds; prompts embed live quotes, so answers go stale quickly
+    
+    # LLM timeouts in seconds (SDK defaults allow up to 10 minutes). A non-streaming answer sends
+    # nothing until generation finishes, so its read budget must cover a full MAX_TOKENS answer
+    LLM_CONNECT_TIMEOUT = 5
+    LLM_COMPLETION_TIMEOUT = 120  # whole non-streaming answer (Gemini: any call's deadline)
+    LLM_STREAM_TIMEOUT = 15  # longest gap allowed between streamed chunks
+    LLM_MAX_ATTEMPTS = 3  # first try plus retries on timeout
+    LLM_RETRY_BACKOFF = 1.0  # seconds, doubled after each timed-out attempt
+    
+    # Explicit LLM connection pool: bounded, so fanned-out gathers can't exhaust file descriptors
+    LLM_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0)
+    LLM_HTTP_TIMEOUT = httpx.Timeout(LLM_COMPLETION_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+    LLM_STREAM_HTTP_TIMEOUT = httpx.Timeout(LLM_STREAM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+    
+    QUOTE_TIMEOUT = 5  # seconds per Finnhub HTTP call, so one slow ticker can't stall a batch
+    REQUEST_TIMEOUT = 10  # seconds to wait on any single data-provider lookup
+    MAX_FETCH_WORKERS = 10  # stay well inside Finnhub's concurrency limit
 
 config = Config()
 
@@ -63,6 +94,74 @@ def safe_api_call(func: Callable, error_msg: str, default_return: Any = None,
         logger.error(f"{error_msg}: {e}")
         return default_return
 
+@st.cache_resource
+def get_http_adapter() -> HTTPAdapter:
+    """
+    Process-wide HTTPS connection pool shared by the data clients
+    
+    Mounted into each client's own session, so Brave and Finnhub keep their
+    headers separate while keep-alive connections are pooled in one place.
+    """
+    return HTTPAdapter(pool_connections=10, pool_maxsize=50)
+
+_ASYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+
+def run_async(coro):
+    """
+    Run a coroutine on the module's long-lived event loop and wait for its result
+    
+    asyncio.run would start a fresh loop per call, and async clients (AsyncOpenAI,
+    Gemini) can't reuse pooled connections across loops.
+    """
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            _ASYNC_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_ASYNC_LOOP.run_forever, name='tab3-async', daemon=True).start()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is _ASYNC_LOOP:
+        # Blocking on .result() here would wait for a loop that can no longer advance
+        coro.close()
+        raise RuntimeError("run_async called from the shared event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, _ASYNC_LOOP).result()
+
+def is_timeout_error(exc: BaseException) -> bool:
+    """True for transport timeouts, including SDK-specific ones (OpenAI, google-api-core)"""
+    return (isinstance(exc, (TimeoutError, requests.Timeout))
+            or type(exc).__name__ in ('APITimeoutError', 'DeadlineExceeded'))
+
+def call_with_retry(func: Callable, attempts: int = config.LLM_MAX_ATTEMPTS,
+                    backoff: float = config.LLM_RETRY_BACKOFF) -> Any:
+    """Call func, retrying timed-out attempts with exponential backoff; other errors propagate"""
+    for attempt in range(attempts):
+        try:
+            return func()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_timeout_error(e):
+                raise
+            logger.warning(f"Request timed out (attempt {attempt + 1}/{attempts}), retrying")
+            time.sleep(backoff * 2 ** attempt)
+
+async def acall_with_retry(func: Callable, attempts: int = config.LLM_MAX_ATTEMPTS,
+                           backoff: float = config.LLM_RETRY_BACKOFF) -> Any:
+    """Async counterpart of call_with_retry; func returns a fresh awaitable per attempt"""
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_timeout_error(e):
+                raise
+            logger.warning(f"Request timed out (attempt {attempt + 1}/{attempts}), retrying")
+            await asyncio.sleep(backoff * 2 ** attempt)
+
+def keyword_re(keywords) -> re.Pattern:
+    """Compile keywords into one substring alternation (a single scan instead of one `in` per word)"""
+    return re.compile('|'.join(map(re.escape, sorted(keywords))))
+
 def format_currency(value: float) -> str:
     """Format number as currency"""
     if value >= 1_000_000_000_000:
@@ -87,24 +186,32 @@ def format_percentage(value: float) -> str:
 class SessionStateManager:
     """Manage Streamlit session state"""
     
+    CHAT_HISTORY_LIMIT = 50  # oldest messages roll off, capping per-rerun render cost
+    
+    # Callables are factories, so every session gets its own history rather than one shared list
     DEFAULTS = {
-        'chat_history_stock': [],
+        'chat_history_stock': lambda: deque(maxlen=SessionStateManager.CHAT_HISTORY_LIMIT),
         'selected_model': 'gpt-4o-mini',
         'selected_provider': 'OpenAI',
         'show_chat': True,
     }
     
+    INITIALIZED_KEY = '_tab3_state_initialized'
+    
     @staticmethod
     def initialize():
-        """Initialize all session state variables"""
+        """Initialize all session state variables (a single flag lookup once the session is set up)"""
+        if st.session_state.get(SessionStateManager.INITIALIZED_KEY):
+            return
         for key, default in SessionStateManager.DEFAULTS.items():
             if key not in st.session_state:
-                st.session_state[key] = default
+                st.session_state[key] = default() if callable(default) else default
+        st.session_state[SessionStateManager.INITIALIZED_KEY] = True
     
     @staticmethod
     def clear_chat():
         """Clear chat history"""
-        st.session_state.chat_history_stock = []
+        st.session_state.chat_history_stock.clear()
     
     @staticmethod
     def add_message(role: str, content: str):
@@ -118,16 +225,22 @@ class SessionStateManager:
 class BraveSearchAPI:
     """Brave Search for real-time market data"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, adapter: Optional[HTTPAdapter] = None):
         validate_api_key(api_key, "Brave API key")
         self.api_key = api_key
         self.base_url = "https://api.search.brave.com/res/v1"
         self.session = requests.Session()
+        if adapter is not None:
+            self.session.mount('https://', adapter)
         self.session.headers.update({
             'Accept': 'application/json',
             'X-Subscription-Token': api_key
         })
     
+    def close(self) -> None:
+        """Close the HTTP session"""
+        self.session.close()
+    
     def search(self, query: str, count: int = 5) -> Optional[Dict]:
         """Perform Brave search"""
         def _search():
@@ -179,13 +292,30 @@ class StockDataProvider(ABC):
         """Get company information"""
         pass
 
+# Heavy SDKs are imported on first use only (yfinance alone costs several hundred ms)
+@functools.lru_cache(maxsize=1)
+def _finnhub():
+    import finnhub
+    return finnhub
+
+@functools.lru_cache(maxsize=1)
+def _yf():
+    import yfinance
+    return yfinance
+
 class FinnhubProvider(StockDataProvider):
     """Finnhub data provider"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, adapter: Optional[HTTPAdapter] = None):
         validate_api_key(api_key, "Finnhub API key")
-        import finnhub
-        self.client = finnhub.Client(api_key=api_key)
+        self.client = _finnhub().Client(api_key=api_key)
+        self.client.DEFAULT_TIMEOUT = config.QUOTE_TIMEOUT
+        if adapter is not None:
+            self.client._session.mount('https://', adapter)
+    
+    def close(self) -> None:
+        """Close the SDK's HTTP session"""
+        self.client.close()
     
     def get_quote(self, ticker: str) -> Optional[Dict]:
         """Get quote from Finnhub"""
@@ -242,9 +372,10 @@ class FinnhubProvider(StockDataProvider):
 class YFinanceProvider(StockDataProvider):
     """Yahoo Finance data provider (fallback)"""
     
-    def __init__(self):
-        import yfinance as yf
-        self.yf = yf
+    @property
+    def yf(self):
+        """yfinance module, imported the first time a lookup actually needs it"""
+        return _yf()
     
     def get_quote(self, ticker: str) -> Optional[Dict]:
         """Get quote from yfinance"""
@@ -296,13 +427,13 @@ class YFinanceProvider(StockDataProvider):
 class StockDataFetcher:
     """Unified stock data fetcher with fallback mechanism"""
     
-    def __init__(self, finnhub_key: Optional[str] = None):
+    def __init__(self, finnhub_key: Optional[str] = None, adapter: Optional[HTTPAdapter] = None):
         self.providers = []
         
         # Add Finnhub if available
         if finnhub_key:
             try:
-                self.providers.append(FinnhubProvider(finnhub_key))
+                self.providers.append(FinnhubProvider(finnhub_key, adapter))
             except Exception as e:
                 logger.warning(f"Finnhub provider unavailable: {e}")
         
@@ -312,27 +443,54 @@ class StockDataFetcher:
         except Exception as e:
             logger.error(f"yfinance provider unavailable: {e}")
     
-    def get_live_stock_price(self, ticker: str) -> Optional[Dict]:
-        """Get live stock price with fallback mechanism"""
+    def close(self) -> None:
+        """Release provider sessions"""
+        for provider in self.providers:
+            if hasattr(provider, 'close'):
+                safe_api_call(provider.close, "Stock provider close error")
+    
+    def get_live_stock_price(self, ticker: str, force_refresh: bool = False) -> Optional[Dict]:
+        """
+        Get live stock price with fallback mechanism
+        
+        Quotes are memoized for 30s and company info for 24h (see
+        _cached_quote / _cached_company_infos); force_refresh bypasses both.
+        """
         if not self.providers:
             logger.error("No stock data providers available")
             return None
         
-        result = {}
-        
-        # Try each provider for quote data
-        for provider in self.providers:
-            quote = provider.get_quote(ticker)
-            if quote:
-                result.update(quote)
-                break
+        if force_refresh:
+            _cached_quote.clear(self, ticker)
+            _cached_company_infos.clear(self, ticker)
         
+        result = _cached_quote(self, ticker)
         if not result:
             return None
         
         # Try to supplement with company info
+        try:
+            company_infos = _cached_company_infos(self, ticker)
+        except LookupError:
+            company_infos = []
+        return self._merge_result(ticker, result, company_infos)
+    
+    def _fetch_quote(self, ticker: str) -> Optional[Dict]:
+        """First quote any provider returns, trying them in order"""
         for provider in self.providers:
-            company_info = provider.get_company_info(ticker)
+            quote = provider.get_quote(ticker)
+            if quote:
+                return quote
+        return None
+    
+    def _fetch_company_infos(self, ticker: str) -> List[Optional[Dict]]:
+        """Company info from every provider, in provider order"""
+        return [provider.get_company_info(ticker) for provider in self.providers]
+    
+    @staticmethod
+    def _merge_result(ticker: str, result: Dict, company_infos: List[Optional[Dict]]) -> Dict:
+        """Fill fields missing from the quote with company info, in provider order"""
+        for company_info in company_infos:
             if company_info:
                 # Only add missing fields
                 for key, value in company_info.items():
@@ -344,6 +502,21 @@ class StockDataFetcher:
         
         return result
 
+# Module-level so Streamlit memoizes across reruns; the fetcher itself is not hashed
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_quote(_fetcher: StockDataFetcher, ticker: str) -> Optional[Dict]:
+    """Live quote, reused for 30s so repeat lookups skip the provider round trip"""
+    return _fetcher._fetch_quote(ticker)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_company_infos(_fetcher: StockDataFetcher, ticker: str) -> List[Optional[Dict]]:
+    """Company profile data, which changes rarely, reused for 24h"""
+    infos = _fetcher._fetch_company_infos(ticker)
+    if not any(infos):
+        # Raising keeps an all-providers failure out of the 24h cache
+        raise LookupError(f"No company info for {ticker}")
+    return infos
+
 # ============================================================================
 # TICKER EXTRACTION
 # ============================================================================
@@ -368,122 +541,275 @@ class TickerExtractor:
         'airbnb': 'ABNB', 'spotify': 'SPOT', 'snap': 'SNAP', 'twitter': 'TWTR',
         'zoom': 'ZM', 'shopify': 'SHOP', 'square': 'SQ', 'robinhood': 'HOOD'
     }
+    KNOWN_TICKERS = frozenset(COMPANY_MAP.values())
+    
+    # Compiled once at import instead of on every extract() call
+    _TICKER_RE = re.compile(r'\b([A-Z]{2,5})\b')
+    _NON_ALPHA_RE = re.compile(r'[^a-zA-Z]')
+    # Deletes everything but a-z in one C-level pass (words are already lowercased)
+    _STRIP_NON_LOWER = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not 'a' <= chr(c) <= 'z'))
+    # Every company alias in one alternation (longest first) so a single scan finds the earliest mention
+    _COMPANY_RE = re.compile('|'.join(re.escape(name) for name in sorted(COMPANY_MAP, key=len, reverse=True)))
     
     @classmethod
     def extract(cls, user_input: str) -> Optional[str]:
         """Extract ticker from natural language input"""
-        import re
-        
         text = user_input.lower().strip()
         
         # Pattern 1: Already a ticker (2-5 uppercase letters)
-        ticker_match = re.search(r'\b([A-Z]{2,5})\b', user_input.upper())
+        ticker_match = cls._TICKER_RE.search(user_input.upper())
         if ticker_match:
             return ticker_match.group(1)
         
         # Pattern 2: Check company name mapping
-        for company, ticker in cls.COMPANY_MAP.items():
-            if company in text:
-                return ticker
+        company_match = cls._COMPANY_RE.search(text)
+        if company_match:
+            return cls.COMPANY_MAP[company_match.group(0)]
         
         # Pattern 3: Extract potential ticker from text
         words = text.split()
         for word in words:
-            word_clean = re.sub(r'[^a-z]', '', word)
-            if 2 <= len(word_clean) <= 5 and word_clean.upper() in cls.COMPANY_MAP.values():
+            word_clean = word.translate(cls._STRIP_NON_LOWER)
+            if 2 <= len(word_clean) <= 5 and word_clean.upper() in cls.KNOWN_TICKERS:
                 return word_clean.upper()
         
         # Pattern 4: Last resort
-        text_clean = re.sub(r'[^a-zA-Z]', '', text)
+        text_clean = cls._NON_ALPHA_RE.sub('', text)
         if 2 <= len(text_clean) <= 5:
             return text_clean.upper()
         
         return None
 
+@functools.lru_cache(maxsize=1024)
+def extract_ticker(text: str) -> Optional[str]:
+    """
+    TickerExtractor.extract memoized per input string
+    
+    Bounded, in-process memo: st.cache_data would pickle every result, which costs
+    more than the regex work it saves.
+    """
+    return TickerExtractor.extract(text)
+
 # ============================================================================
 # LLM INTERFACE (ABSTRACTED)
 # ============================================================================
 
+# LLM SDKs are imported once, the first time a provider of that kind is built
+@functools.lru_cache(maxsize=1)
+def _openai():
+    import openai
+    return openai
+
+@functools.lru_cache(maxsize=1)
+def _genai():
+    import google.generativeai as genai
+    return genai
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
+    FAILURE_MESSAGE = "Failed to get response from LLM"
+    
     @abstractmethod
     def generate_response(self, prompt: str, system_prompt: str = "") -> str:
         """Generate response from LLM"""
         pass
+    
+    async def agenerate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate response without blocking the event loop (thread fallback for sync-only SDKs)"""
+        return await asyncio.to_thread(self.generate_response, prompt, system_prompt)
+    
+    def generate_response_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        """Yield the response in chunks as they arrive (single chunk for non-streaming SDKs)"""
+        yield self.generate_response(prompt, system_prompt)
 
 class OpenAIProvider(LLMProvider):
     """OpenAI LLM provider"""
     
+    FAILURE_MESSAGE = "Failed to get response from OpenAI"
+    
     def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
         validate_api_key(api_key, "OpenAI API key")
-        from openai import OpenAI
-        self.client = OpenAI(api_key=api_key)
+        openai = _openai()
+        # The SDK retries timeouts (and 429/5xx) itself with exponential backoff
+        client_options = dict(api_key=api_key, timeout=config.LLM_HTTP_TIMEOUT,
+                              max_retries=config.LLM_MAX_ATTEMPTS - 1)
+        # HTTP/2 multiplexes concurrent completions over a few pooled connections
+        self._http = httpx.Client(limits=config.LLM_HTTP_LIMITS, http2=True)
+        self._async_http = httpx.AsyncClient(limits=config.LLM_HTTP_LIMITS, http2=True)
+        self.client = openai.OpenAI(http_client=self._http, **client_options)
+        self.async_client = openai.AsyncOpenAI(http_client=self._async_http, **client_options)
         self.model = model
     
+    @staticmethod
+    def _messages(prompt: str, system_prompt: str) -> List[Dict]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
     def generate_response(self, prompt: str, system_prompt: str = "") -> str:
         """Generate response from OpenAI"""
         def _generate():
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=self._messages(prompt, system_prompt),
                 max_tokens=config.MAX_TOKENS,
                 temperature=config.TEMPERATURE
             )
             return response.choices[0].message.content
         
         result = safe_api_call(_generate, "OpenAI API error")
-        return result if result else "Failed to get response from OpenAI"
+        return result if result else self.FAILURE_MESSAGE
+    
+    def generate_response_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        """Stream response tokens from OpenAI"""
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._messages(prompt, system_prompt),
+                max_tokens=config.MAX_TOKENS,
+                temperature=config.TEMPERATURE,
+                stream=True,
+                timeout=config.LLM_STREAM_HTTP_TIMEOUT  # chunks keep arriving, so a stall shows up fast
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            yield self.FAILURE_MESSAGE
+    
+    async def agenerate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate response from OpenAI on the async client"""
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=self._messages(prompt, system_prompt),
+                max_tokens=config.MAX_TOKENS,
+                temperature=config.TEMPERATURE
+            )
+            result = response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            result = None
+        return result if result else self.FAILURE_MESSAGE
 
 class GeminiProvider(LLMProvider):
     """Google Gemini LLM provider"""
     
+    FAILURE_MESSAGE = "Failed to get response from Gemini"
+    
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
         validate_api_key(api_key, "Gemini API key")
-        import google.generativeai as genai
+        genai = _genai()
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model)
+        # The deadline covers the whole call, streamed or not, so it gets the full-answer budget
+        self.request_options = {'timeout': config.LLM_COMPLETION_TIMEOUT}
     
     def generate_response(self, prompt: str, system_prompt: str = "") -> str:
         """Generate response from Gemini"""
         def _generate():
             full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
-            response = self.model.generate_content(full_prompt)
+            response = call_with_retry(
+                lambda: self.model.generate_content(full_prompt, request_options=self.request_options)
+            )
             return response.text
         
         result = safe_api_call(_generate, "Gemini API error")
-        return result if result else "Failed to get response from Gemini"
+        return result if result else self.FAILURE_MESSAGE
+    
+    def generate_response_stream(self, prompt: str, system_prompt: str = "") -> Iterator[str]:
+        """Stream response chunks from Gemini"""
+        full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        try:
+            for chunk in self.model.generate_content(full_prompt, stream=True,
+                                                     request_options=self.request_options):
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            yield self.FAILURE_MESSAGE
+    
+    async def agenerate_response(self, prompt: str, system_prompt: str = "") -> str:
+        """Generate response from Gemini without blocking the event loop"""
+        full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        try:
+            response = await acall_with_retry(
+                lambda: self.model.generate_content_async(full_prompt, request_options=self.request_options)
+            )
+            result = response.text
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            result = None
+        return result if result else self.FAILURE_MESSAGE
+
+class LLMCache:
+    """Exact-match TTL cache of LLM responses, keyed by a hash of the full request"""
+    
+    def __init__(self, maxsize: int = config.LLM_CACHE_SIZE, ttl: float = config.LLM_CACHE_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()  # TTLCache is not thread-safe
+    
+    @staticmethod
+    def make_key(provider_name: str, model: str, system_prompt: str, prompt: str) -> str:
+        payload = json.dumps({'provider': provider_name, 'model': model,
+                              'system_prompt': system_prompt, 'prompt': prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._cache.get(key)
+    
+    def set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._cache[key] = response
+
+_LLM_CACHE = LLMCache()
+
+# One provider per (provider, model): clients and their keep-alive pools outlive a single query
+_PROVIDER_CACHE: Dict[Tuple[str, str], LLMProvider] = {}
+_PROVIDER_CACHE_LOCK = threading.Lock()
 
 class LLMManager:
     """Manage LLM providers"""
     
     @staticmethod
     def get_provider(provider_name: str, model: str) -> Optional[LLMProvider]:
-        """Get LLM provider instance"""
-        try:
-            if provider_name == "OpenAI":
-                return OpenAIProvider(config.OPENAI_API_KEY, model)
-            elif provider_name == "Gemini":
-                return GeminiProvider(config.GEMINI_API_KEY, model)
-            else:
-                raise ValueError(f"Unknown provider: {provider_name}")
-        except Exception as e:
-            logger.error(f"Failed to initialize {provider_name}: {e}")
-            return None
+        """Get LLM provider instance (built once per provider/model, failures are retried next call)"""
+        key = (provider_name, model)
+        with _PROVIDER_CACHE_LOCK:
+            provider = _PROVIDER_CACHE.get(key)
+            if provider is not None:
+                return provider
+            try:
+                if provider_name == "OpenAI":
+                    provider = OpenAIProvider(config.OPENAI_API_KEY, model)
+                elif provider_name == "Gemini":
+                    provider = GeminiProvider(config.GEMINI_API_KEY, model)
+                else:
+                    raise ValueError(f"Unknown provider: {provider_name}")
+            except Exception as e:
+                logger.error(f"Failed to initialize {provider_name}: {e}")
+                return None
+            _PROVIDER_CACHE[key] = provider
+            return provider
+    
+    @staticmethod
+    async def aget_provider(provider_name: str, model: str) -> Optional[LLMProvider]:
+        """get_provider for async callers: a first-time client build runs off the event loop"""
+        provider = _PROVIDER_CACHE.get((provider_name, model))
+        if provider is not None:
+            return provider
+        return await asyncio.to_thread(LLMManager.get_provider, provider_name, model)
 
 # ============================================================================
 # RESPONSE TEMPLATES
 # ============================================================================
 
-class ResponseTemplates:
-    """Pre-defined response templates for common queries"""
-    
-    AI_TRENDS = """
+_TPL_AI_TRENDS = """
 # 🤖 AI Trends in Finance
 
 AI is revolutionizing finance in several key ways:
@@ -515,7 +841,7 @@ Hyper-personalized wealth management
 **Bottom Line:** AI is making finance faster, smarter, and more accessible!
 """
 
-    STOCK_INSIGHTS = """
+_TPL_STOCK_INSIGHTS = """
 # Stock Market Insights
 
 ## Key Points:
@@ -539,7 +865,7 @@ Stock markets are influenced by earnings, economic data, and sentiment. Technica
 *For specific stock prices or comparisons, ask about specific tickers!*
 """
 
-    PORTFOLIO_STRATEGY = """
+_TPL_PORTFOLIO_STRATEGY = """
 # Investment Strategy Insights
 
 ## Portfolio Building Principles:
@@ -564,7 +890,7 @@ Only invest what you can afford to lose. Build emergency fund first (3-6 months
 Invest fixed amounts regularly. Reduces timing risk and takes emotion out of investing.
 """
 
-    MARKET_ANALYSIS = """
+_TPL_MARKET_ANALYSIS = """
 # Market & Economic Analysis
 
 ## Current Economic Landscape:
@@ -595,7 +921,7 @@ Follow economic indicators, read financial news (WSJ, Bloomberg, Reuters), under
 *Markets are cyclical - patience and strategy matter!*
 """
 
-    TRADING_CONCEPTS = """
+_TPL_TRADING_CONCEPTS = """
 # Trading Strategies & Concepts
 
 ## Trading Styles:
@@ -623,26 +949,12 @@ Control emotions (fear and greed), stick to your strategy, accept losses as part
 ⚠️ **Warning:** Trading is risky. Most traders lose money. Start with paper trading first!
 """
 
-    @classmethod
-    def get_fallback_response(cls, question: str) -> str:
-        """Get appropriate fallback response based on question"""
-        q = question.lower()
-        
-        if 'ai' in q and any(word in q for word in ['trend', 'future', 'impact']):
-            return cls.AI_TRENDS
-        elif any(word in q for word in ['stock', 'share', 'equity', 'ticker']):
-            return f"{cls.STOCK_INSIGHTS}\n\n**Your question:** {question}"
-        elif any(word in q for word in ['portfolio', 'invest', 'allocation', 'diversif']):
-            return f"{cls.PORTFOLIO_STRATEGY}\n\n**Your question:** {question}"
-        elif any(word in q for word in ['market', 'economy', 'recession', 'inflation', 'fed']):
-            return f"{cls.MARKET_ANALYSIS}\n\n**Your question:** {question}"
-        elif any(word in q for word in ['trading', 'day trade', 'swing', 'options', 'futures']):
-            return cls.TRADING_CONCEPTS
-        else:
-            return f"""
+_TPL_GENERAL_HEAD = """
 # 💡 General Financial Guidance
 
-**Your question:** {question}
+**Your question:** """
+
+_TPL_GENERAL_TAIL = """
 
 I can help you with:
 - Live stock prices (just ask "price of AAPL" or "Tesla stock")
@@ -655,6 +967,69 @@ I can help you with:
 Please ask a more specific question about stocks, investing, or markets!
 """
 
+_QUESTION_SUFFIX = "\n\n**Your question:** "
+
+# Fallback text per category, with the question echo prefix prebuilt where the
+# answer repeats the question
+_FALLBACKS = {
+    'ai': _TPL_AI_TRENDS,
+    'stock': _TPL_STOCK_INSIGHTS + _QUESTION_SUFFIX,
+    'portfolio': _TPL_PORTFOLIO_STRATEGY + _QUESTION_SUFFIX,
+    'market': _TPL_MARKET_ANALYSIS + _QUESTION_SUFFIX,
+    'trading': _TPL_TRADING_CONCEPTS,
+    'general': _TPL_GENERAL_HEAD,
+}
+_ECHOES_QUESTION = frozenset({'stock', 'portfolio', 'market', 'general'})
+
+class ResponseTemplates:
+    """Pre-defined response templates for common queries"""
+    
+    AI_TRENDS = _TPL_AI_TRENDS
+    STOCK_INSIGHTS = _TPL_STOCK_INSIGHTS
+    PORTFOLIO_STRATEGY = _TPL_PORTFOLIO_STRATEGY
+    MARKET_ANALYSIS = _TPL_MARKET_ANALYSIS
+    TRADING_CONCEPTS = _TPL_TRADING_CONCEPTS
+    
+    # Keyword groups for the fallback classifier. Matching stays substring-based
+    # ('stocks', 'diversification', 'day trade' must still hit), so each group is
+    # compiled once into a single alternation instead of rescanning a list per word
+    _AI_KW = frozenset({'trend', 'future', 'impact'})
+    _STOCK_KW = frozenset({'stock', 'share', 'equity', 'ticker'})
+    _PORTFOLIO_KW = frozenset({'portfolio', 'invest', 'allocation', 'diversif'})
+    _MARKET_KW = frozenset({'market', 'economy', 'recession', 'inflation', 'fed'})
+    _TRADING_KW = frozenset({'trading', 'day trade', 'swing', 'options', 'futures'})
+    
+    # Checked in priority order after the AI rule
+    _CATEGORY_RULES = (
+        ('stock', keyword_re(_STOCK_KW)),
+        ('portfolio', keyword_re(_PORTFOLIO_KW)),
+        ('market', keyword_re(_MARKET_KW)),
+        ('trading', keyword_re(_TRADING_KW)),
+    )
+    _AI_RE = keyword_re(_AI_KW)
+    
+    @classmethod
+    def classify(cls, question: str) -> str:
+        """Fallback category for a question ('general' when nothing matches)"""
+        q = question.lower()
+        if 'ai' in q and cls._AI_RE.search(q):
+            return 'ai'
+        for category, pattern in cls._CATEGORY_RULES:
+            if pattern.search(q):
+                return category
+        return 'general'
+    
+    @classmethod
+    def get_fallback_response(cls, question: str) -> str:
+        """Get appropriate fallback response based on question"""
+        category = cls.classify(question)
+        response = _FALLBACKS[category]
+        if category == 'general':
+            return response + question + _TPL_GENERAL_TAIL
+        if category in _ECHOES_QUESTION:
+            return response + question
+        return response
+
 # ============================================================================
 # PORTFOLIO BUILDER
 # ============================================================================
@@ -666,38 +1041,46 @@ class PortfolioBuilder:
         'Conservative': {
             'description': 'Low risk, steady returns',
             'allocation': {'stocks': 40, 'bonds': 50, 'cash': 10},
+            'fractions': (0.40, 0.50, 0.10),  # stocks, bonds, cash as multipliers
             'expected_return': '4-6%',
             'volatility': 'Low'
         },
         'Moderate': {
             'description': 'Balanced growth and stability',
             'allocation': {'stocks': 60, 'bonds': 30, 'cash': 10},
+            'fractions': (0.60, 0.30, 0.10),  # stocks, bonds, cash as multipliers
             'expected_return': '6-8%',
             'volatility': 'Medium'
         },
         'Aggressive': {
             'description': 'High growth potential, higher risk',
             'allocation': {'stocks': 80, 'bonds': 15, 'cash': 5},
+            'fractions': (0.80, 0.15, 0.05),  # stocks, bonds, cash as multipliers
             'expected_return': '8-12%',
             'volatility': 'High'
         },
         'Very Aggressive': {
             'description': 'Maximum growth, maximum risk',
             'allocation': {'stocks': 95, 'bonds': 5, 'cash': 0},
+            'fractions': (0.95, 0.05, 0.00),  # stocks, bonds, cash as multipliers
             'expected_return': '10-15%',
             'volatility': 'Very High'
         }
     }
     
     STOCK_CATEGORIES = {
-        'Large Cap Tech': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA'],
-        'Large Cap Value': ['JPM', 'JNJ', 'PG', 'KO', 'WMT'],
-        'Growth Stocks': ['TSLA', 'NFLX', 'SHOP', 'SPOT', 'SQ'],
-        'Dividend Stocks': ['T', 'VZ', 'PFE', 'XOM', 'CVX'],
-        'Financial': ['JPM', 'BAC', 'GS', 'MS', 'C'],
-        'Healthcare': ['JNJ', 'PFE', 'UNH', 'MRK', 'ABBV'],
+        'Large Cap Tech': ('AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA'),
+        'Large Cap Value': ('JPM', 'JNJ', 'PG', 'KO', 'WMT'),
+        'Growth Stocks': ('TSLA', 'NFLX', 'SHOP', 'SPOT', 'SQ'),
+        'Dividend Stocks': ('T', 'VZ', 'PFE', 'XOM', 'CVX'),
+        'Financial': ('JPM', 'BAC', 'GS', 'MS', 'C'),
+        'Healthcare': ('JNJ', 'PFE', 'UNH', 'MRK', 'ABBV'),
     }
     
+    # Precomputed so build_portfolio doesn't re-slice on every call
+    _DEFAULT_CATEGORIES = tuple(STOCK_CATEGORIES)[:3]
+    _TOP2_BY_CATEGORY = {category: tickers[:2] for category, tickers in STOCK_CATEGORIES.items()}
+    
     @classmethod
     def build_portfolio(cls, risk_profile: str, investment_amount: float, 
                        include_categories: List[str] = None) -> Dict:
@@ -710,18 +1093,18 @@ class PortfolioBuilder:
         allocation = profile['allocation']
         
         # Calculate amounts per asset class
-        stock_amount = investment_amount * (allocation['stocks'] / 100)
-        bond_amount = investment_amount * (allocation['bonds'] / 100)
-        cash_amount = investment_amount * (allocation['cash'] / 100)
+        stock_frac, bond_frac, cash_frac = profile['fractions']
+        stock_amount = investment_amount * stock_frac
+        bond_amount = investment_amount * bond_frac
+        cash_amount = investment_amount * cash_frac
         
         # Select stocks from categories
         if include_categories is None:
-            include_categories = list(cls.STOCK_CATEGORIES.keys())[:3]
+            include_categories = cls._DEFAULT_CATEGORIES
         
         selected_stocks = []
         for category in include_categories:
-            if category in cls.STOCK_CATEGORIES:
-                selected_stocks.extend(cls.STOCK_CATEGORIES[category][:2])
+            selected_stocks.extend(cls._TOP2_BY_CATEGORY.get(category, ()))
         
         # Distribute stock amount
         stock_per_position = stock_amount / len(selected_stocks) if selected_stocks else 0
@@ -734,7 +1117,7 @@ class PortfolioBuilder:
                 'stocks': {
                     'amount': stock_amount,
                     'percentage': allocation['stocks'],
-                    'positions': {stock: stock_per_position for stock in selected_stocks}
+                    'positions': dict.fromkeys(selected_stocks, stock_per_position)
                 },
                 'bonds': {
                     'amount': bond_amount,
@@ -777,17 +1160,30 @@ class PortfolioBuilder:
 class StockComparator:
     """Compare multiple stocks"""
     
+    NO_DATA_MESSAGE = "Could not fetch data for comparison"
+    
     def __init__(self, stock_fetcher: StockDataFetcher):
         self.stock_fetcher = stock_fetcher
     
     def compare_stocks(self, tickers: List[str]) -> Dict:
         """Compare multiple stocks"""
         comparison = {}
+        if not tickers:
+            return comparison
         
-        for ticker in tickers:
-            data = self.stock_fetcher.get_live_stock_price(ticker)
-            if data:
-                comparison[ticker] = data
+        # Submit every lookup before collecting any, so the report waits on the slowest ticker, not the sum
+        executor = ThreadPoolExecutor(max_workers=min(len(tickers), config.MAX_FETCH_WORKERS))
+        try:
+            futures = {ticker: executor.submit(self.stock_fetcher.get_live_stock_price, ticker)
+                       for ticker in tickers}
+            for ticker, future in futures.items():
+                data = safe_api_call(future.result, f"Comparison fetch error for {ticker}",
+                                     None, timeout=config.REQUEST_TIMEOUT)
+                if data:
+                    comparison[ticker] = data
+        finally:
+            # Don't block the report on a lookup that already timed out
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return comparison
     
@@ -796,74 +1192,120 @@ class StockComparator:
         comparison = self.compare_stocks(tickers)
         
         if not comparison:
-            return "Could not fetch data for comparison"
-        
-        report = f"# Stock Comparison: {', '.join(tickers)}\n\n"
-        
-        # Price comparison
-        report += "## Current Prices\n\n"
-        report += "| Ticker | Price | Change | Change % |\n"
-        report += "|--------|-------|--------|----------|\n"
-        
-        for ticker, data in comparison.items():
-            report += f"| {ticker} | ${data['price']:.2f} | "
-            report += f"${data['change']:+.2f} | {data['change_percent']:+.2f}% |\n"
+            return self.NO_DATA_MESSAGE
         
-        # Valuation comparison
-        report += "\n## Valuation Metrics\n\n"
-        report += "| Ticker | P/E Ratio | Market Cap |\n"
-        report += "|--------|-----------|------------|\n"
+        # One pass: build both table bodies and track best/worst/lowest P/E as we go
+        price_rows = []
+        valuation_rows = []
+        best = worst = lowest_pe = None
+        best_pct = float('-inf')
+        worst_pct = lowest_pe_value = float('inf')
         
         for ticker, data in comparison.items():
-            pe = f"{data.get('pe_ratio', 0):.2f}" if data.get('pe_ratio') else "N/A"
-            mcap = format_currency(data['market_cap']) if data.get('market_cap') else "N/A"
-            report += f"| {ticker} | {pe} | {mcap} |\n"
-        
-        # Analysis
-        report += "\n## Quick Analysis\n\n"
-        
-        # Find best performer
-        best_performer = max(comparison.items(), key=lambda x: x[1]['change_percent'])
-        worst_performer = min(comparison.items(), key=lambda x: x[1]['change_percent'])
-        
-        report += f"**Best Performer Today:** {best_performer[0]} "
-        report += f"({best_performer[1]['change_percent']:+.2f}%)\n\n"
-        report += f"**Worst Performer Today:** {worst_performer[0]} "
-        report += f"({worst_performer[1]['change_percent']:+.2f}%)\n\n"
+            change_pct = data['change_percent']
+            pe_ratio = data.get('pe_ratio')
+            market_cap = data.get('market_cap')
+            
+            price_rows.append(f"| {ticker} | ${data['price']:.2f} | "
+                              f"${data['change']:+.2f} | {change_pct:+.2f}% |\n")
+            pe = f"{pe_ratio:.2f}" if pe_ratio else "N/A"
+            mcap = format_currency(market_cap) if market_cap else "N/A"
+            valuation_rows.append(f"| {ticker} | {pe} | {mcap} |\n")
+            
+            # Strict comparisons keep the first ticker on ties, as max()/min() did
+            if change_pct > best_pct:
+                best, best_pct = ticker, change_pct
+            if change_pct < worst_pct:
+                worst, worst_pct = ticker, change_pct
+            if pe_ratio and pe_ratio < lowest_pe_value:
+                lowest_pe, lowest_pe_value = ticker, pe_ratio
+        
+        parts = [
+            f"# Stock Comparison: {', '.join(tickers)}\n\n",
+            # Price comparison
+            "## Current Prices\n\n",
+            "| Ticker | Price | Change | Change % |\n",
+            "|--------|-------|--------|----------|\n",
+            *price_rows,
+            # Valuation comparison
+            "\n## Valuation Metrics\n\n",
+            "| Ticker | P/E Ratio | Market Cap |\n",
+            "|--------|-----------|------------|\n",
+            *valuation_rows,
+            # Analysis
+            "\n## Quick Analysis\n\n",
+            f"**Best Performer Today:** {best} ({best_pct:+.2f}%)\n\n",
+            f"**Worst Performer Today:** {worst} ({worst_pct:+.2f}%)\n\n",
+        ]
         
-        # P/E comparison
-        stocks_with_pe = {k: v for k, v in comparison.items() if v.get('pe_ratio')}
-        if stocks_with_pe:
-            lowest_pe = min(stocks_with_pe.items(), key=lambda x: x[1]['pe_ratio'])
-            report += f"**Lowest P/E (Most Undervalued):** {lowest_pe[0]} "
-            report += f"(P/E: {lowest_pe[1]['pe_ratio']:.2f})\n\n"
+        if lowest_pe is not None:
+            parts.append(f"**Lowest P/E (Most Undervalued):** {lowest_pe} "
+                         f"(P/E: {lowest_pe_value:.2f})\n\n")
         
-        report += "\n💡 *Remember: Past performance doesn't guarantee future results. "
-        report += "Always do your own research!*"
+        parts.append("\n💡 *Remember: Past performance doesn't guarantee future results. "
+                     "Always do your own research!*")
         
-        return report
+        return "".join(parts)
 
 # ============================================================================
 # CHATBOT LOGIC
 # ============================================================================
 
+@st.cache_resource
+def get_stock_fetcher() -> StockDataFetcher:
+    """Process-wide fetcher: providers and their HTTP clients are built once, not per rerun"""
+    return StockDataFetcher(config.FINNHUB_API_KEY, get_http_adapter())
+
+@st.cache_resource
+def get_brave_api() -> Optional[BraveSearchAPI]:
+    """Process-wide Brave client so its requests.Session keeps pooled connections across reruns"""
+    if not config.BRAVE_API_KEY:
+        return None
+    try:
+        return BraveSearchAPI(config.BRAVE_API_KEY, get_http_adapter())
+    except Exception as e:
+        logger.warning(f"Brave API unavailable: {e}")
+        return None
+
+# Query dispatch patterns, compiled once per process
+_TICKER_RE = re.compile(r'\b([A-Z]{2,5})\b')
+_AMOUNT_RE = re.compile(r'\$?([\d,]+)')
+_SYMBOL_RE = re.compile(r'[A-Z.\-]{1,6}')  # plausible exchange symbol, e.g. BRK.B
+
+_PORTFOLIO_QUERY_KW = frozenset({'portfolio', 'build', 'create portfolio', 'invest',
+                                 'allocation', 'diversif', 'risk profile'})
+_COMPARISON_QUERY_KW = frozenset({'compare', 'vs', 'versus', 'better', 'difference between'})
+_PRICE_QUERY_KW = frozenset({'price', 'stock', 'quote', 'trading at'})
+# All three groups in one pattern: a single scan of the query reports which categories it hits
+_QUERY_KW_RE = re.compile('|'.join(
+    f'(?P<{name}>{keyword_re(keywords).pattern})'
+    for name, keywords in (('portfolio', _PORTFOLIO_QUERY_KW),
+                           ('comparison', _COMPARISON_QUERY_KW),
+                           ('price', _PRICE_QUERY_KW))
+))
+
 class StockChatbot:
     """Main chatbot orchestrator"""
     
     def __init__(self, quant_df: Optional[pd.DataFrame] = None):
         self.quant_df = quant_df
-        self.stock_fetcher = StockDataFetcher(config.FINNHUB_API_KEY)
+        self._system_prompt: Optional[str] = None  # rendered lazily, reset by set_quant_df
+        self.stock_fetcher = get_stock_fetcher()
         self.comparator = StockComparator(self.stock_fetcher)
-        self.brave_api = None
-        
-        if config.BRAVE_API_KEY:
-            try:
-                self.brave_api = BraveSearchAPI(config.BRAVE_API_KEY)
-            except Exception as e:
-                logger.warning(f"Brave API unavailable: {e}")
+        self.brave_api = get_brave_api()
+    
+    def set_quant_df(self, quant_df: Optional[pd.DataFrame]) -> None:
+        """Swap the quantitative data and drop the system prompt rendered from the old frame"""
+        self.quant_df = quant_df
+        self._system_prompt = None
     
     def create_system_prompt(self) -> str:
-        """Create system prompt with context"""
+        """System prompt with context, rendered once (quant_df.to_string is the costly part)"""
+        if self._system_prompt is None:
+            self._system_prompt = self._render_system_prompt()
+        return self._system_prompt
+    
+    def _render_system_prompt(self) -> str:
         context = ""
         if self.quant_df is not None and not self.quant_df.empty:
             context = f"\n\nAvailable stocks data:\n{self.quant_df.to_string()}"
@@ -890,35 +1332,30 @@ Guidelines:
 
 Remember: Always mention that this is not financial advice and users should do their own research."""
     
-    def detect_query_type(self, query: str) -> str:
-        """Detect the type of query"""
-        q = query.lower()
-        
-        # Portfolio building keywords
-        if any(word in q for word in ['portfolio', 'build', 'create portfolio', 'invest', 
-                                       'allocation', 'diversif', 'risk profile']):
-            return 'portfolio'
-        
-        # Comparison keywords
-        if any(word in q for word in ['compare', 'vs', 'versus', 'better', 
-                                       'difference between']):
-            # Check if multiple tickers mentioned
-            import re
-            tickers = re.findall(r'\b([A-Z]{2,5})\b', query)
-            if len(tickers) >= 2:
-                return 'comparison'
-        
-        # Price lookup
-        ticker = TickerExtractor.extract(query)
-        if ticker and any(word in q for word in ['price', 'stock', 'quote', 'trading at']):
+    def detect_query_type(self, query: str, q_lower: Optional[str] = None) -> str:
+        """Detect the type of query (q_lower: the query already lowercased, if the caller has it)"""
+        # One pass over the query; portfolio wins outright, so stop as soon as it shows up
+        matched = set()
+        for match in _QUERY_KW_RE.finditer(q_lower if q_lower is not None else query.lower()):
+            if match.lastgroup == 'portfolio':
+                return 'portfolio'
+            matched.add(match.lastgroup)
+        
+        # Comparison needs at least two tickers mentioned
+        if 'comparison' in matched and len(_TICKER_RE.findall(query)) >= 2:
+            return 'comparison'
+        
+        # Price lookup (keyword check first: it's cheaper than ticker extraction)
+        if 'price' in matched and extract_ticker(query):
             return 'price'
         
         # General chat
         return 'general'
     
-    def handle_portfolio_query(self, query: str, provider_name: str, model: str) -> str:
+    def handle_portfolio_query(self, query: str, provider_name: str, model: str,
+                               q_lower: Optional[str] = None) -> str:
         """Handle portfolio building queries"""
-        q = query.lower()
+        q = q_lower if q_lower is not None else query.lower()
         
         # Detect risk profile
         risk_profile = 'Moderate'  # Default
@@ -930,8 +1367,7 @@ Remember: Always mention that this is not financial advice and users should do t
             risk_profile = 'Very Aggressive'
         
         # Try to extract investment amount
-        import re
-        amount_match = re.search(r'\$?([\d,]+)', query)
+        amount_match = _AMOUNT_RE.search(query)
         investment_amount = 10000  # Default
         if amount_match:
             investment_amount = float(amount_match.group(1).replace(',', ''))
@@ -944,119 +1380,312 @@ Remember: Always mention that this is not financial advice and users should do t
         )
         
         # Format response
-        response = f"# 💼 Custom Portfolio: {risk_profile}\n\n"
-        response += f"**Investment Amount:** ${investment_amount:,.2f}\n\n"
-        response += f"**Profile:** {portfolio['profile_details']['description']}\n"
-        response += f"**Expected Return:** {portfolio['profile_details']['expected_return']}\n"
-        response += f"**Volatility:** {portfolio['profile_details']['volatility']}\n\n"
-        
-        response += "## Asset Allocation\n\n"
+        profile = portfolio['profile_details']
+        parts = [
+            f"# 💼 Custom Portfolio: {risk_profile}\n\n",
+            f"**Investment Amount:** ${investment_amount:,.2f}\n\n",
+            f"**Profile:** {profile['description']}\n",
+            f"**Expected Return:** {profile['expected_return']}\n",
+            f"**Volatility:** {profile['volatility']}\n\n",
+            "## Asset Allocation\n\n",
+        ]
         
         # Stocks
         stock_alloc = portfolio['allocation']['stocks']
-        response += f"### Stocks ({stock_alloc['percentage']}% - ${stock_alloc['amount']:,.2f})\n"
-        response += "| Ticker | Allocation |\n|--------|------------|\n"
-        for stock, amount in stock_alloc['positions'].items():
-            response += f"| {stock} | ${amount:,.2f} |\n"
-        response += "\n"
+        parts.append(f"### Stocks ({stock_alloc['percentage']}% - ${stock_alloc['amount']:,.2f})\n")
+        parts.append("| Ticker | Allocation |\n|--------|------------|\n")
+        parts.extend(f"| {stock} | ${amount:,.2f} |\n" for stock, amount in stock_alloc['positions'].items())
+        parts.append("\n")
         
         # Bonds
         bond_alloc = portfolio['allocation']['bonds']
-        response += f"### Bonds ({bond_alloc['percentage']}% - ${bond_alloc['amount']:,.2f})\n"
-        response += "**Recommended ETFs:**\n"
-        for bond in bond_alloc['recommendations']:
-            response += f"- {bond}\n"
-        response += "\n"
+        parts.append(f"### Bonds ({bond_alloc['percentage']}% - ${bond_alloc['amount']:,.2f})\n")
+        parts.append("**Recommended ETFs:**\n")
+        parts.extend(f"- {bond}\n" for bond in bond_alloc['recommendations'])
+        parts.append("\n")
         
         # Cash
         cash_alloc = portfolio['allocation']['cash']
         if cash_alloc['percentage'] > 0:
-            response += f"### Cash ({cash_alloc['percentage']}% - ${cash_alloc['amount']:,.2f})\n"
-            response += "**Recommended options:**\n"
-            for option in cash_alloc['recommendations']:
-                response += f"- {option}\n"
-            response += "\n"
-        
-        response += "\n## Key Recommendations\n\n"
-        response += "1. **Diversify** across sectors and asset classes\n"
-        response += "2. **Rebalance** quarterly or when allocation drifts >5%\n"
-        response += "3. **Dollar-cost average** for consistent investing\n"
-        response += "4. **Review annually** and adjust based on goals\n"
-        response += "5. **Emergency fund** first - keep 3-6 months expenses\n\n"
-        
-        response += "⚠️ *This is not financial advice. Consult with a financial advisor.*"
-        
-        return response
+            parts.append(f"### Cash ({cash_alloc['percentage']}% - ${cash_alloc['amount']:,.2f})\n")
+            parts.append("**Recommended options:**\n")
+            parts.extend(f"- {option}\n" for option in cash_alloc['recommendations'])
+            parts.append("\n")
+        
+        parts.append("\n## Key Recommendations\n\n"
+                     "1. **Diversify** across sectors and asset classes\n"
+                     "2. **Rebalance** quarterly or when allocation drifts >5%\n"
+                     "3. **Dollar-cost average** for consistent investing\n"
+                     "4. **Review annually** and adjust based on goals\n"
+                     "5. **Emergency fund** first - keep 3-6 months expenses\n\n"
+                     "⚠️ *This is not financial advice. Consult with a financial advisor.*")
+        
+        return "".join(parts)
     
     def handle_comparison_query(self, query: str) -> str:
         """Handle stock comparison queries"""
-        import re
-        tickers = re.findall(r'\b([A-Z]{2,5})\b', query)
+        tickers = _TICKER_RE.findall(query)
         
         if len(tickers) < 2:
             return "Please provide at least 2 stock tickers to compare (e.g., 'Compare AAPL vs MSFT')"
         
         return self.comparator.generate_comparison_report(tickers[:5])  # Limit to 5 stocks
     
-    def process_query(self, user_query: str, provider_name: str, model: str) -> str:
-        """Process user query and generate response"""
+    async def _afetch_price(self, ticker: str) -> Optional[Dict]:
+        """Quote lookup off the event loop (the provider SDKs are synchronous)"""
+        return await asyncio.to_thread(self.stock_fetcher.get_live_stock_price, ticker)
+    
+    async def _afetch_news(self, ticker: str) -> Optional[List[Dict]]:
+        """Brave news lookup off the event loop; None when search isn't configured"""
+        if not self.brave_api:
+            return None
+        return await asyncio.to_thread(self.brave_api.get_stock_news, ticker)
+    
+    @staticmethod
+    def _stream_and_cache(chunks: Iterator[str], cache_key: str, failure_message: str) -> Iterator[str]:
+        """Pass chunks through to the UI and cache the assembled answer once the stream completes"""
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        if parts and parts[-1] != failure_message:
+            _LLM_CACHE.set(cache_key, ''.join(parts))
+    
+    async def _aenrich(self, ticker: str) -> Tuple[Optional[Dict], Optional[List[Dict]]]:
+        """Price and news for a ticker; both are independent HTTP round trips, so overlap them"""
+        stock_data, news = await asyncio.gather(
+            self._afetch_price(ticker), self._afetch_news(ticker), return_exceptions=True
+        )
+        if isinstance(stock_data, BaseException):
+            logger.error(f"Price fetch failed for {ticker}: {stock_data}")
+            stock_data = None
+        if isinstance(news, BaseException):
+            logger.error(f"News fetch failed for {ticker}: {news}")
+            news = None
+        return stock_data, news
+    
+    @staticmethod
+    def _build_prompt(user_query: str, ticker: Optional[str], stock_data: Optional[Dict],
+                      news: Optional[List[Dict]], with_timestamp: bool = True) -> str:
+        """
+        User query enriched with live stock data and headlines, when there are any
+        
+        with_timestamp=False leaves out the fetch time, which changes on every
+        lookup, so the text can serve as a response-cache key.
+        """
+        if not ticker or not stock_data:
+            return user_query
+        
+        # Format stock data
+        price_info = f"""
+**Live Stock Data for {ticker}:**
+- Current Price: ${stock_data['price']:.2f}
+- Change: {format_percentage(stock_data['change_percent'])}
+- Previous Close: ${stock_data['previous_close']:.2f}
+"""
+        if stock_data.get('pe_ratio'):
+            price_info += f"- P/E Ratio: {stock_data['pe_ratio']:.2f}\n"
+        if stock_data.get('market_cap'):
+            price_info += f"- Market Cap: {format_currency(stock_data['market_cap'])}\n"
+        if stock_data.get('volume'):
+            price_info += f"- Volume: {stock_data['volume']:,}\n"
+        
+        if with_timestamp:
+            price_info += f"- Last Updated: {stock_data['timestamp']}\n"
+        
+        enhanced_prompt = f"{user_query}\n\n{price_info}"
+        
+        if news:
+            news_text = "\n\n**Recent News:**\n"
+            for item in news[:3]:
+                news_text += f"- {item['title']}\n"
+            enhanced_prompt += news_text
+        
+        return enhanced_prompt
+    
+    @classmethod
+    def _cache_key(cls, provider_name: str, model: str, system_prompt: str, user_query: str,
+                   ticker: Optional[str], stock_data: Optional[Dict], news: Optional[List[Dict]]) -> str:
+        """Response-cache key: the query plus quote and headlines, without the quote's fetch time"""
+        return LLMCache.make_key(provider_name, model, system_prompt,
+                                 cls._build_prompt(user_query, ticker, stock_data, news, with_timestamp=False))
+    
+    @staticmethod
+    async def _agenerate_cached(llm: LLMProvider, cache_key: str, prompt: str, system_prompt: str) -> str:
+        """LLM answer via the response cache; failures are never cached"""
+        response = _LLM_CACHE.get(cache_key)
+        if response is None:
+            response = await llm.agenerate_response(prompt, system_prompt)
+            if response != llm.FAILURE_MESSAGE:
+                _LLM_CACHE.set(cache_key, response)
+        return response
+    
+    async def _asystem_prompt(self) -> str:
+        """System prompt, rendered in a worker thread the first time so the shared loop isn't blocked"""
+        if self._system_prompt is not None:
+            return self._system_prompt
+        return await asyncio.to_thread(self.create_system_prompt)
+    
+    async def aprocess_query(self, user_query: str, provider_name: str, model: str,
+                             stream: bool = False) -> Union[str, Iterator[str]]:
+        """
+        Process user query: price and news are fetched concurrently, then the LLM is awaited
         
-        query_type = self.detect_query_type(user_query)
+        With stream=True an LLM answer comes back as a chunk iterator (for st.write_stream);
+        canned and cached answers are still returned as plain strings.
+        """
+        
+        q_lower = user_query.lower()  # lowercased once for every handler below
+        query_type = self.detect_query_type(user_query, q_lower)
         
         # Handle specific query types
         if query_type == 'portfolio':
-            return self.handle_portfolio_query(user_query, provider_name, model)
+            return self.handle_portfolio_query(user_query, provider_name, model, q_lower)
         
         if query_type == 'comparison':
-            return self.handle_comparison_query(user_query)
+            # Blocks on quote futures: keep it off the loop every session's LLM calls share
+            return await asyncio.to_thread(self.handle_comparison_query, user_query)
         
         # Handle price lookups and general queries
-        ticker = TickerExtractor.extract(user_query)
-        enhanced_prompt = user_query
-        
-        if ticker:
-            stock_data = self.stock_fetcher.get_live_stock_price(ticker)
-            
-            if stock_data:
-                # Format stock data
-                price_info = f"""
-**Live Stock Data for {ticker}:**
-- Current Price: ${stock_data['price']:.2f}
-- Change: {format_percentage(stock_data['change_percent'])}
-- Previous Close: ${stock_data['previous_close']:.2f}
-"""
-                if stock_data.get('pe_ratio'):
-                    price_info += f"- P/E Ratio: {stock_data['pe_ratio']:.2f}\n"
-                if stock_data.get('market_cap'):
-                    price_info += f"- Market Cap: {format_currency(stock_data['market_cap'])}\n"
-                if stock_data.get('volume'):
-                    price_info += f"- Volume: {stock_data['volume']:,}\n"
-                
-                price_info += f"- Last Updated: {stock_data['timestamp']}\n"
-                
-                enhanced_prompt = f"{user_query}\n\n{price_info}"
-                
-                # Try to get news
-                if self.brave_api:
-                    news = self.brave_api.get_stock_news(ticker)
-                    if news:
-                        news_text = "\n\n**Recent News:**\n"
-                        for item in news[:3]:
-                            news_text += f"- {item['title']}\n"
-                        enhanced_prompt += news_text
+        ticker = extract_ticker(user_query)
+        stock_data, news = await self._aenrich(ticker) if ticker else (None, None)
+        enhanced_prompt = self._build_prompt(user_query, ticker, stock_data, news)
         
         # Get LLM response for general queries
-        llm = LLMManager.get_provider(provider_name, model)
+        llm = await LLMManager.aget_provider(provider_name, model)
         
-        if llm:
-            return llm.generate_response(enhanced_prompt, self.create_system_prompt())
-        else:
+        if not llm:
             return ResponseTemplates.get_fallback_response(user_query)
+        
+        # Repeat questions within the TTL skip the round trip (TEMPERATURE is low enough
+        # that a cached answer is as good as a fresh one)
+        system_prompt = await self._asystem_prompt()
+        cache_key = self._cache_key(provider_name, model, system_prompt, user_query, ticker, stock_data, news)
+        if stream and _LLM_CACHE.get(cache_key) is None:
+            return self._stream_and_cache(llm.generate_response_stream(enhanced_prompt, system_prompt),
+                                          cache_key, llm.FAILURE_MESSAGE)
+        return await self._agenerate_cached(llm, cache_key, enhanced_prompt, system_prompt)
+    
+    def process_query(self, user_query: str, provider_name: str, model: str,
+                      stream: bool = False) -> Union[str, Iterator[str]]:
+        """Process user query and generate response (sync entry point for the UI)"""
+        return run_async(self.aprocess_query(user_query, provider_name, model, stream))
+    
+    async def aprocess_queries_batch(self, queries: List[str], provider_name: str, model: str) -> List[str]:
+        """
+        Answer several queries together, in input order
+        
+        Comparisons and the price/news enrichment for every distinct ticker run
+        concurrently, then all LLM-bound prompts are sent in one gather.
+        """
+        responses: List[Optional[str]] = [None] * len(queries)
+        comparisons: Dict[int, str] = {}
+        llm_tickers: Dict[int, Optional[str]] = {}
+        
+        for i, query in enumerate(queries):
+            q_lower = query.lower()
+            query_type = self.detect_query_type(query, q_lower)
+            if query_type == 'portfolio':
+                responses[i] = self.handle_portfolio_query(query, provider_name, model, q_lower)
+            elif query_type == 'comparison':
+                comparisons[i] = query
+            else:
+                llm_tickers[i] = extract_ticker(query)
+        
+        # Each ticker is enriched once, however many queries mention it
+        tickers = list(dict.fromkeys(t for t in llm_tickers.values() if t))
+        reports, enrichments = await asyncio.gather(
+            asyncio.gather(*(asyncio.to_thread(self.handle_comparison_query, q) for q in comparisons.values()),
+                           return_exceptions=True),
+            asyncio.gather(*(self._aenrich(t) for t in tickers)),
+        )
+        for i, report in zip(comparisons, reports):
+            if isinstance(report, BaseException):
+                logger.error(f"Comparison failed for {queries[i]!r}: {report}")
+                report = ResponseTemplates.get_fallback_response(queries[i])
+            responses[i] = report
+        enrichment = dict(zip(tickers, enrichments))
+        
+        if llm_tickers:
+            llm = await LLMManager.aget_provider(provider_name, model)
+            if llm:
+                system_prompt = await self._asystem_prompt()
+                answers = await asyncio.gather(*(
+                    self._agenerate_cached(
+                        llm,
+                        self._cache_key(provider_name, model, system_prompt, queries[i], t, *enrichment.get(t, (None, None))),
+                        self._build_prompt(queries[i], t, *enrichment.get(t, (None, None))),
+                        system_prompt
+                    )
+                    for i, t in llm_tickers.items()
+                ))
+            else:
+                answers = [ResponseTemplates.get_fallback_response(queries[i]) for i in llm_tickers]
+            for i, answer in zip(llm_tickers, answers):
+                responses[i] = answer
+        
+        return responses
+    
+    def process_queries_batch(self, queries: List[str], provider_name: str, model: str) -> List[str]:
+        """Sync entry point for aprocess_queries_batch"""
+        return run_async(self.aprocess_queries_batch(queries, provider_name, model))
 
 # ============================================================================
 # STREAMLIT UI
 # ============================================================================
 
+@st.cache_resource(show_spinner=False)
+def get_chatbot(quant_df: Optional[pd.DataFrame]) -> StockChatbot:
+    """
+    Shared chatbot, rebuilt only when quant_df's contents change
+    
+    Streamlit hashes the frame's contents for the key, and cache_resource hands
+    back the same object rather than a copy, so the clients and the rendered
+    system prompt survive reruns.
+    """
+    return StockChatbot(quant_df)
+
+# Rendered quotes for the lookup widgets: a rerun within a minute re-renders from memory
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_price(_fetcher: StockDataFetcher, ticker: str) -> Dict:
+    data = _fetcher.get_live_stock_price(ticker)
+    if not data:
+        # Raising keeps a failed lookup out of the cache so the next click retries
+        raise LookupError(f"No price data for {ticker}")
+    return data
+
+def cached_price(fetcher: StockDataFetcher, ticker: str) -> Optional[Dict]:
+    """Live price for a UI widget, memoized for 60s (None if every provider failed)"""
+    try:
+        return _cached_price(fetcher, ticker)
+    except LookupError:
+        return None
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_report(_comparator: StockComparator, tickers: Tuple[str, ...]) -> str:
+    report = _comparator.generate_comparison_report(list(tickers))
+    if report == StockComparator.NO_DATA_MESSAGE:
+        raise LookupError(report)  # not cached: the next click tries the providers again
+    return report
+
+def cached_comparison_report(comparator: StockComparator, tickers: List[str]) -> str:
+    """Comparison markdown for a ticker list, memoized for 2 minutes"""
+    try:
+        return _cached_report(comparator, tuple(tickers))
+    except LookupError:
+        return StockComparator.NO_DATA_MESSAGE
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_portfolio(risk_profile: str, investment_amount: float, categories: Tuple[str, ...]) -> Dict:
+    """build_portfolio memoized on its (small, discrete) inputs; no categories means the defaults"""
+    return PortfolioBuilder.build_portfolio(risk_profile, investment_amount,
+                                            include_categories=list(categories) or None)
+
+def fetch_many(fetcher: StockDataFetcher, tickers: List[str]) -> Dict[str, Optional[Dict]]:
+    """cached_price for several tickers, looked up concurrently"""
+    with ThreadPoolExecutor(max_workers=min(len(tickers), 8) or 1) as executor:
+        return dict(zip(tickers, executor.map(lambda t: cached_price(fetcher, t), tickers)))
+
 def render_stock_price_display(ticker: str, stock_data: Dict):
     """Render stock price in a nice card format"""
     col1, col2, col3 = st.columns(3)
@@ -1076,6 +1705,59 @@ def render_stock_price_display(ticker: str, stock_data: Dict):
         if stock_data.get('market_cap'):
             st.metric("Market Cap", format_currency(stock_data['market_cap']))
 
+def render_many_prices(tickers: List[str], prices, changes, pct_changes, columns) -> None:
+    """
+    One metric per ticker, each in its own column
+    
+    Labels and deltas are formatted for all tickers in one vectorized pass
+    instead of three f-strings per metric.
+    """
+    values = np.char.mod("$%.2f", np.asarray(prices, dtype=np.float64))
+    deltas = np.char.add(np.char.mod("%+.2f", np.asarray(changes, dtype=np.float64)),
+                         np.char.mod(" (%+.2f%%)", np.asarray(pct_changes, dtype=np.float64)))
+    for column, ticker, value, delta in zip(columns, tickers, values, deltas):
+        with column:
+            st.metric(ticker, str(value), str(delta))
+
+# Background lookups started by the UI (news alongside quotes, cache warm-ups)
+_UI_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tab3-ui')
+
+# Likely comparison peers by sector (yfinance) or industry (Finnhub) label
+SECTOR_PEERS = {
+    'Technology': ('AAPL', 'MSFT', 'GOOGL', 'NVDA', 'META'),
+    'Communication Services': ('GOOGL', 'META', 'NFLX', 'DIS'),
+    'Media': ('GOOGL', 'META', 'NFLX', 'DIS'),
+    'Consumer Cyclical': ('AMZN', 'TSLA', 'HD', 'NKE'),
+    'Retail': ('AMZN', 'WMT', 'COST', 'TGT'),
+    'Automobiles': ('TSLA', 'F', 'GM', 'TM'),
+    'Financial Services': ('JPM', 'BAC', 'WFC', 'C', 'GS'),
+    'Banking': ('JPM', 'BAC', 'WFC', 'C', 'GS'),
+    'Healthcare': ('JNJ', 'PFE', 'UNH', 'MRK', 'ABBV'),
+    'Pharmaceuticals': ('JNJ', 'PFE', 'MRK', 'ABBV'),
+    'Energy': ('XOM', 'CVX'),
+}
+MAX_PREFETCH_PEERS = 4
+
+def prefetch_peers(fetcher: StockDataFetcher, ticker: str, data: Dict) -> None:
+    """Warm the price cache for the ticker's sector peers in the background (fire and forget)"""
+    sector_peers = SECTOR_PEERS.get(data.get('sector') or data.get('industry'), ())
+    for peer in [p for p in sector_peers if p != ticker][:MAX_PREFETCH_PEERS]:
+        _UI_EXECUTOR.submit(cached_price, fetcher, peer)
+
+CHAT_TAIL_MESSAGES = 10  # newest messages rendered as individual chat bubbles
+_ROLE_LABELS = {'user': 'You', 'assistant': 'Assistant'}
+
+# Example questions, pre-joined into one markdown block per column (alternating, as before)
+_EXAMPLES = (
+    "What's the current price of Apple?",
+    "Compare Tesla and Ford stocks",
+    "Should I invest in tech stocks?",
+    "Explain P/E ratio",
+    "What are the AI trends in finance?",
+    "Build me a balanced portfolio for $10,000"
+)
+_EXAMPLES_MD = tuple("  \n".join(f"• {example}" for example in _EXAMPLES[i::2]) for i in range(2))
+
 def render_chat_interface(chatbot: StockChatbot):
     """Render the chat interface"""
     
@@ -1104,8 +1786,17 @@ def render_chat_interface(chatbot: StockChatbot):
             SessionStateManager.clear_chat()
             st.rerun()
     
-    # Display chat history
-    for role, message in st.session_state.chat_history_stock:
+    # Display chat history. Every rerun has to re-emit it (Streamlit drops what a run
+    # doesn't repeat), so only the recent tail gets one element per message; older
+    # turns go out as a single markdown block
+    history = list(st.session_state.chat_history_stock)
+    older, recent = history[:-CHAT_TAIL_MESSAGES], history[-CHAT_TAIL_MESSAGES:]
+    if older:
+        with st.expander(f"Earlier messages ({len(older)})", expanded=False):
+            st.markdown("\n\n---\n\n".join(
+                f"**{_ROLE_LABELS.get(role, role)}:**\n\n{message}" for role, message in older
+            ))
+    for role, message in recent:
         with st.chat_message(role):
             st.markdown(message)
     
@@ -1117,246 +1808,121 @@ def render_chat_interface(chatbot: StockChatbot):
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Generate response
+        # Generate response (LLM answers stream in token by token)
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
+            try:
+                with st.spinner("Thinking..."):
                     response = chatbot.process_query(
                         prompt,
                         st.session_state.selected_provider,
-                        st.session_state.selected_model
+                        st.session_state.selected_model,
+                        stream=True
                     )
-                except Exception as e:
-                    st.error(f"Error: {str(e)}")
-                    response = ResponseTemplates.get_fallback_response(prompt)
-                
+                if isinstance(response, str):
+                    st.markdown(response)
+                else:
+                    response = st.write_stream(response)
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+                response = ResponseTemplates.get_fallback_response(prompt)
                 st.markdown(response)
         
         # Save response
         SessionStateManager.add_message("assistant", response)
         st.rerun()
 
-def render_tab3(quant_df: Optional[pd.DataFrame] = None, news_df: Optional[pd.DataFrame] = None):
-    """Main render function for Tab 3"""
+@st.fragment
+def _render_chat_tab(chatbot: StockChatbot):
+    """AI Chat sub-tab"""
+    st.markdown("### Chat with AI Stock Assistant")
+    st.markdown("Ask me anything about stocks, markets, investing, or finance!")
     
-    # Initialize session state
-    SessionStateManager.initialize()
+    render_chat_interface(chatbot)
     
-    st.title("AI Stock Market Assistant")
-    st.markdown("Get live prices, compare stocks, build portfolios, and receive AI-powered investment insights!")
+    # Example queries
+    with st.expander("Example Questions", expanded=False):
+        for col, examples_md in zip(st.columns(2), _EXAMPLES_MD):
+            with col:
+                st.markdown(examples_md)
+
+@st.fragment
+def _render_compare_tab(chatbot: StockChatbot, quant_df: Optional[pd.DataFrame]):
+    """Compare Stocks sub-tab"""
+    st.markdown("### Stock Comparison Tool")
+    st.markdown("Compare multiple stocks side-by-side with detailed metrics")
     
-    # Create sub-tabs
-    sub_tab1, sub_tab2, sub_tab3, sub_tab4 = st.tabs([
-        "Quick Lookup", 
-        "Compare Stocks", 
-        "Portfolio Builder",
-        "AI Chat"
-    ])
+    col1, col2 = st.columns([3, 1])
     
-    # Initialize chatbot once
-    chatbot = StockChatbot(quant_df)
+    with col1:
+        tickers_input = st.text_input(
+            "Enter stock tickers (comma-separated)",
+            placeholder="e.g., AAPL, MSFT, GOOGL, AMZN",
+            key="compare_tickers"
+        )
     
-    # ========== TAB 1: AI CHAT ==========
-    with sub_tab4:
-        st.markdown("### Chat with AI Stock Assistant")
-        st.markdown("Ask me anything about stocks, markets, investing, or finance!")
-        
-        render_chat_interface(chatbot)
-        
-        # Example queries
-        with st.expander("Example Questions", expanded=False):
-            examples = [
-                "What's the current price of Apple?",
-                "Compare Tesla and Ford stocks",
-                "Should I invest in tech stocks?",
-                "Explain P/E ratio",
-                "What are the AI trends in finance?",
-                "Build me a balanced portfolio for $10,000"
-            ]
-            
-            cols = st.columns(2)
-            for i, example in enumerate(examples):
-                with cols[i % 2]:
-                    st.markdown(f"• {example}")
+    with col2:
+        compare_button = st.button("Compare", use_container_width=True, type="primary")
     
-    # ========== TAB 2: COMPARE STOCKS ==========
-    with sub_tab2:
-        st.markdown("### Stock Comparison Tool")
-        st.markdown("Compare multiple stocks side-by-side with detailed metrics")
+    if compare_button and tickers_input:
+        # Ordered de-dupe, and drop anything that can't be a symbol before it costs a round trip
+        candidates = dict.fromkeys(t.strip().upper() for t in tickers_input.split(',') if t.strip())
+        tickers = [t for t in candidates if _SYMBOL_RE.fullmatch(t)]
+        invalid = [t for t in candidates if not _SYMBOL_RE.fullmatch(t)]
+        if invalid:
+            st.warning(f"Ignoring invalid ticker(s): {', '.join(invalid)}")
         
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            tickers_input = st.text_input(
-                "Enter stock tickers (comma-separated)",
-                placeholder="e.g., AAPL, MSFT, GOOGL, AMZN",
-                key="compare_tickers"
-            )
-        
-        with col2:
-            compare_button = st.button("Compare", use_container_width=True, type="primary")
-        
-        if compare_button and tickers_input:
-            tickers = [t.strip().upper() for t in tickers_input.split(',')]
-            
-            if len(tickers) < 2:
-                st.error("Please enter at least 2 tickers to compare")
-            elif len(tickers) > 5:
+        if len(tickers) < 2:
+            st.error("Please enter at least 2 tickers to compare")
+        else:
+            if len(tickers) > 5:
                 st.warning("Comparing first 5 stocks only")
                 tickers = tickers[:5]
             
             with st.spinner("Fetching stock data..."):
-                report = chatbot.comparator.generate_comparison_report(tickers)
-                st.markdown(report)
-        
-        # Quick comparison presets
-        st.markdown("#### Quick Comparisons")
-        
-        preset_cols = st.columns(3)
-        
-        with preset_cols[0]:
-            if st.button("Big Tech (FAANG)", use_container_width=True):
-                report = chatbot.comparator.generate_comparison_report(
-                    ['META', 'AAPL', 'AMZN', 'NFLX', 'GOOGL']
-                )
+                report = cached_comparison_report(chatbot.comparator, tickers)
                 st.markdown(report)
-        
-        with preset_cols[1]:
-            if st.button("Banks", use_container_width=True):
-                report = chatbot.comparator.generate_comparison_report(
-                    ['JPM', 'BAC', 'WFC', 'C', 'GS']
-                )
-                st.markdown(report)
-        
-        with preset_cols[2]:
-            if st.button("Auto Industry", use_container_width=True):
-                report = chatbot.comparator.generate_comparison_report(
-                    ['TSLA', 'F', 'GM', 'TM']
-                )
-                st.markdown(report)
-        
-        # Show quant data if available
-        if quant_df is not None and not quant_df.empty:
-            st.markdown("---")
-            st.markdown("#### Quantitative Analysis Data")
-            st.dataframe(quant_df, use_container_width=True)
     
-    # ========== TAB 3: PORTFOLIO BUILDER ==========
-    with sub_tab3:
-        st.markdown("### Personalized Portfolio Builder")
-        st.markdown("Build a customized investment portfolio based on your risk profile")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            risk_profile = st.selectbox(
-                "Select Your Risk Profile",
-                options=list(PortfolioBuilder.RISK_PROFILES.keys()),
-                index=1,  # Default to Moderate
-                key="portfolio_risk"
+    # Quick comparison presets
+    st.markdown("#### Quick Comparisons")
+    
+    preset_cols = st.columns(3)
+    
+    with preset_cols[0]:
+        if st.button("Big Tech (FAANG)", use_container_width=True):
+            report = cached_comparison_report(
+                chatbot.comparator,
+                ['META', 'AAPL', 'AMZN', 'NFLX', 'GOOGL']
             )
-            
-            # Show risk profile details
-            profile_details = PortfolioBuilder.RISK_PROFILES[risk_profile]
-            st.info(f"""
-**{profile_details['description']}**
-
-- Expected Return: {profile_details['expected_return']}
-- Volatility: {profile_details['volatility']}
-- Stock Allocation: {profile_details['allocation']['stocks']}%
-- Bond Allocation: {profile_details['allocation']['bonds']}%
-- Cash Allocation: {profile_details['allocation']['cash']}%
-            """)
-        
-        with col2:
-            investment_amount = st.number_input(
-                "Investment Amount ($)",
-                min_value=1000,
-                max_value=10000000,
-                value=10000,
-                step=1000,
-                key="portfolio_amount"
+            st.markdown(report)
+    
+    with preset_cols[1]:
+        if st.button("Banks", use_container_width=True):
+            report = cached_comparison_report(
+                chatbot.comparator,
+                ['JPM', 'BAC', 'WFC', 'C', 'GS']
             )
-            
-            st.markdown("#### Select Investment Categories")
-            categories = st.multiselect(
-                "Choose stock categories to include",
-                options=list(PortfolioBuilder.STOCK_CATEGORIES.keys()),
-                default=['Large Cap Tech', 'Large Cap Value', 'Dividend Stocks'],
-                key="portfolio_categories"
+            st.markdown(report)
+    
+    with preset_cols[2]:
+        if st.button("Auto Industry", use_container_width=True):
+            report = cached_comparison_report(
+                chatbot.comparator,
+                ['TSLA', 'F', 'GM', 'TM']
             )
-        
-        if st.button("Build My Portfolio", use_container_width=True, type="primary"):
-            with st.spinner("Building your personalized portfolio..."):
-                portfolio = PortfolioBuilder.build_portfolio(
-                    risk_profile,
-                    investment_amount,
-                    include_categories=categories if categories else None
-                )
-                
-                # Display portfolio
-                st.success("Portfolio created successfully!")
-                
-                st.markdown(f"## Your {risk_profile} Portfolio")
-                st.markdown(f"**Total Investment:** ${investment_amount:,.2f}")
-                
-                # Asset allocation pie chart
-                st.markdown("### Asset Allocation")
-                
-                allocation_data = pd.DataFrame({
-                    'Asset Class': ['Stocks', 'Bonds', 'Cash'],
-                    'Percentage': [
-                        portfolio['allocation']['stocks']['percentage'],
-                        portfolio['allocation']['bonds']['percentage'],
-                        portfolio['allocation']['cash']['percentage']
-                    ],
-                    'Amount': [
-                        portfolio['allocation']['stocks']['amount'],
-                        portfolio['allocation']['bonds']['amount'],
-                        portfolio['allocation']['cash']['amount']
-                    ]
-                })
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.dataframe(allocation_data, use_container_width=True, hide_index=True)
-                
-                with col2:
-                    # Simple text representation since we don't have plotly
-                    st.markdown("**Allocation Breakdown:**")
-                    for _, row in allocation_data.iterrows():
-                        st.markdown(f"- **{row['Asset Class']}:** {row['Percentage']}% (${row['Amount']:,.2f})")
-                
-                # Stock positions
-                st.markdown("### Stock Positions")
-                stock_positions = portfolio['allocation']['stocks']['positions']
-                
-                stock_df = pd.DataFrame([
-                    {'Ticker': ticker, 'Allocation': f"${amount:,.2f}"}
-                    for ticker, amount in stock_positions.items()
-                ])
-                
-                st.dataframe(stock_df, use_container_width=True, hide_index=True)
-                
-                # Bonds and Cash recommendations
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("### Bond Recommendations")
-                    for bond in portfolio['allocation']['bonds']['recommendations']:
-                        st.markdown(f"- {bond}")
-                
-                with col2:
-                    if portfolio['allocation']['cash']['percentage'] > 0:
-                        st.markdown("### 💵 Cash Recommendations")
-                        for option in portfolio['allocation']['cash']['recommendations']:
-                            st.markdown(f"- {option}")
-                
-                # Key recommendations
-                st.markdown("---")
-                st.markdown("### Key Investment Principles")
-                st.markdown("""
+            st.markdown(report)
+    
+    # Show quant data if available
+    if quant_df is not None and not quant_df.empty:
+        st.markdown("---")
+        st.markdown("#### Quantitative Analysis Data")
+        st.dataframe(quant_df, use_container_width=True)
+
+# Widget options, built once instead of on every rerun
+_RISK_OPTIONS = tuple(PortfolioBuilder.RISK_PROFILES)
+_CATEGORY_OPTIONS = tuple(PortfolioBuilder.STOCK_CATEGORIES)
+
+# Static text shown under every generated portfolio
+_PRINCIPLES_MD = """### Key Investment Principles
 1. **Diversify** across sectors and asset classes to reduce risk
 2. **Rebalance** quarterly or when allocation drifts more than 5%
 3. **Dollar-cost average** by investing regularly rather than timing the market
@@ -1364,98 +1930,265 @@ def render_tab3(quant_df: Optional[pd.DataFrame] = None, news_df: Optional[pd.Da
 5. **Emergency fund first** - maintain 3-6 months of expenses before investing
 6. **Long-term focus** - avoid emotional reactions to short-term market volatility
 7. **Tax efficiency** - consider tax-advantaged accounts (401k, IRA, etc.)
-                """)
-                
-                st.warning("**Disclaimer:** This is not financial advice. Please consult with a certified financial advisor before making investment decisions.")
+"""
+_DISCLAIMER_MD = ("**Disclaimer:** This is not financial advice. Please consult with a certified financial "
+                  "advisor before making investment decisions.")
+
+@st.fragment
+def _render_portfolio_tab():
+    """Portfolio Builder sub-tab"""
+    st.markdown("### Personalized Portfolio Builder")
+    st.markdown("Build a customized investment portfolio based on your risk profile")
     
-    # ========== TAB 4: QUICK LOOKUP ==========
-    with sub_tab1:
-        st.markdown("### Quick Stock Price Lookup")
-        st.markdown("Get instant stock prices and key metrics")
-        
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            quick_ticker = st.text_input(
-                "Enter ticker or company name",
-                placeholder="e.g., AAPL, Tesla, Microsoft",
-                key="quick_lookup_ticker"
-            )
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        risk_profile = st.selectbox(
+            "Select Your Risk Profile",
+            options=_RISK_OPTIONS,
+            index=1,  # Default to Moderate
+            key="portfolio_risk"
+        )
         
-        with col2:
-            lookup_button = st.button("Get Price", use_container_width=True, type="primary")
+        # Show risk profile details
+        profile_details = PortfolioBuilder.RISK_PROFILES[risk_profile]
+        st.info(f"""
+**{profile_details['description']}**
+
+- Expected Return: {profile_details['expected_return']}
+- Volatility: {profile_details['volatility']}
+- Stock Allocation: {profile_details['allocation']['stocks']}%
+- Bond Allocation: {profile_details['allocation']['bonds']}%
+- Cash Allocation: {profile_details['allocation']['cash']}%
+        """)
+    
+    with col2:
+        investment_amount = st.number_input(
+            "Investment Amount ($)",
+            min_value=1000,
+            max_value=10000000,
+            value=10000,
+            step=1000,
+            key="portfolio_amount"
+        )
         
-        if lookup_button and quick_ticker:
-            ticker = TickerExtractor.extract(quick_ticker)
+        st.markdown("#### Select Investment Categories")
+        categories = st.multiselect(
+            "Choose stock categories to include",
+            options=_CATEGORY_OPTIONS,
+            default=['Large Cap Tech', 'Large Cap Value', 'Dividend Stocks'],
+            key="portfolio_categories"
+        )
+    
+    if st.button("Build My Portfolio", use_container_width=True, type="primary"):
+        with st.spinner("Building your personalized portfolio..."):
+            portfolio = cached_portfolio(risk_profile, investment_amount, tuple(categories))
+            
+            # Display portfolio
+            st.success("Portfolio created successfully!")
+            
+            st.markdown(f"## Your {risk_profile} Portfolio")
+            st.markdown(f"**Total Investment:** ${investment_amount:,.2f}")
+            
+            # Asset allocation pie chart
+            st.markdown("### Asset Allocation")
+            
+            allocation_data = pd.DataFrame({
+                'Asset Class': ['Stocks', 'Bonds', 'Cash'],
+                'Percentage': [
+                    portfolio['allocation']['stocks']['percentage'],
+                    portfolio['allocation']['bonds']['percentage'],
+                    portfolio['allocation']['cash']['percentage']
+                ],
+                'Amount': [
+                    portfolio['allocation']['stocks']['amount'],
+                    portfolio['allocation']['bonds']['amount'],
+                    portfolio['allocation']['cash']['amount']
+                ]
+            })
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.table(allocation_data, hide_index=True)
+            
+            with col2:
+                # Simple text representation since we don't have plotly
+                st.markdown("**Allocation Breakdown:**\n" + "\n".join(
+                    f"- **{asset_class}:** {pct}% (${amount:,.2f})"
+                    for asset_class, pct, amount in zip(allocation_data['Asset Class'],
+                                                        allocation_data['Percentage'],
+                                                        allocation_data['Amount'])
+                ))
+            
+            # Stock positions
+            st.markdown("### Stock Positions")
+            stock_positions = portfolio['allocation']['stocks']['positions']
+            
+            # Columnar construction: no per-row dicts for pandas to re-normalize
+            stock_df = pd.DataFrame({
+                'Ticker': list(stock_positions),
+                'Allocation': [f"${amount:,.2f}" for amount in stock_positions.values()]
+            })
+            
+            st.table(stock_df, hide_index=True)
+            
+            # Bonds and Cash recommendations
+            col1, col2 = st.columns(2)
             
-            if ticker:
-                with st.spinner(f"Fetching data for {ticker}..."):
-                    data = chatbot.stock_fetcher.get_live_stock_price(ticker)
+            with col1:
+                st.markdown("### Bond Recommendations")
+                st.markdown("\n".join(f"- {bond}" for bond in portfolio['allocation']['bonds']['recommendations']))
+            
+            with col2:
+                if portfolio['allocation']['cash']['percentage'] > 0:
+                    st.markdown("### 💵 Cash Recommendations")
+                    st.markdown("\n".join(f"- {option}" for option in portfolio['allocation']['cash']['recommendations']))
+            
+            # Key recommendations
+            st.markdown("---")
+            st.markdown(_PRINCIPLES_MD)
+            
+            st.warning(_DISCLAIMER_MD)
+
+@st.fragment
+def _render_lookup_tab(chatbot: StockChatbot):
+    """Quick Lookup sub-tab"""
+    st.markdown("### Quick Stock Price Lookup")
+    st.markdown("Get instant stock prices and key metrics")
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        quick_ticker = st.text_input(
+            "Enter ticker or company name",
+            placeholder="e.g., AAPL, Tesla, Microsoft",
+            key="quick_lookup_ticker"
+        )
+    
+    with col2:
+        lookup_button = st.button("Get Price", use_container_width=True, type="primary")
+    
+    if lookup_button and quick_ticker:
+        ticker = extract_ticker(quick_ticker)
+        
+        if ticker:
+            # Price and news are independent round trips: start both, render each as it lands
+            news_future = (_UI_EXECUTOR.submit(chatbot.brave_api.get_stock_news, ticker)
+                           if chatbot.brave_api else None)
+            with st.spinner(f"Fetching data for {ticker}..."):
+                data = cached_price(chatbot.stock_fetcher, ticker)
+                
+                if data:
+                    render_stock_price_display(ticker, data)
+                    # The user often compares against peers next; fetch those while they read
+                    prefetch_peers(chatbot.stock_fetcher, ticker, data)
                     
-                    if data:
-                        render_stock_price_display(ticker, data)
+                    # Additional details
+                    with st.expander("Detailed Information", expanded=True):
+                        col1, col2, col3 = st.columns(3)
                         
-                        # Additional details
-                        with st.expander("Detailed Information", expanded=True):
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                if data.get('open'):
-                                    st.metric("Open", f"${data['open']:.2f}")
-                                if data.get('high'):
-                                    st.metric("Day High", f"${data['high']:.2f}")
-                            
-                            with col2:
-                                if data.get('low'):
-                                    st.metric("Day Low", f"${data['low']:.2f}")
-                                if data.get('volume'):
-                                    st.metric("Volume", f"{data['volume']:,}")
-                            
-                            with col3:
-                                if data.get('name'):
-                                    st.markdown(f"**Company:** {data['name']}")
-                                if data.get('industry'):
-                                    st.markdown(f"**Industry:** {data['industry']}")
-                                if data.get('sector'):
-                                    st.markdown(f"**Sector:** {data['sector']}")
+                        with col1:
+                            if data.get('open'):
+                                st.metric("Open", f"${data['open']:.2f}")
+                            if data.get('high'):
+                                st.metric("Day High", f"${data['high']:.2f}")
+                        
+                        with col2:
+                            if data.get('low'):
+                                st.metric("Day Low", f"${data['low']:.2f}")
+                            if data.get('volume'):
+                                st.metric("Volume", f"{data['volume']:,}")
                         
-                        # Try to get news
-                        if chatbot.brave_api:
-                            with st.spinner("Fetching latest news..."):
-                                news = chatbot.brave_api.get_stock_news(ticker)
+                        with col3:
+                            if data.get('name'):
+                                st.markdown(f"**Company:** {data['name']}")
+                            if data.get('industry'):
+                                st.markdown(f"**Industry:** {data['industry']}")
+                            if data.get('sector'):
+                                st.markdown(f"**Sector:** {data['sector']}")
+                    
+                    # News was requested alongside the price
+                    if news_future is not None:
+                        with st.spinner("Fetching latest news..."):
+                            news = safe_api_call(news_future.result, "Brave news error", [])
+                            
+                            if news:
+                                st.markdown("---")
+                                st.markdown("### 📰 Latest News")
                                 
-                                if news:
-                                    st.markdown("---")
-                                    st.markdown("### 📰 Latest News")
-                                    
-                                    for item in news[:5]:
-                                        with st.container():
-                                            st.markdown(f"**[{item['title']}]({item['url']})**")
-                                            if item['description']:
-                                                st.markdown(item['description'])
-                                            st.markdown("")
-                    else:
-                        st.error(f"Could not fetch data for {ticker}")
-            else:
-                st.error("Could not identify ticker from input")
-        
-        # Popular stocks quick buttons
-        st.markdown("---")
-        st.markdown("#### Popular Stocks")
-        
-        popular_cols = st.columns(6)
-        popular_stocks = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA']
-        
-        for i, ticker in enumerate(popular_stocks):
-            with popular_cols[i]:
-                if st.button(ticker, use_container_width=True):
-                    data = chatbot.stock_fetcher.get_live_stock_price(ticker)
-                    if data:
-                        st.metric(
-                            ticker,
-                            f"${data['price']:.2f}",
-                            f"{data['change_percent']:+.2f}%"
-                        )
+                                # One element for all headlines instead of three per item
+                                st.markdown("\n\n".join(
+                                    f"**[{item['title']}]({item['url']})**"
+                                    + (f"\n\n{item['description']}" if item['description'] else "")
+                                    for item in news[:5]
+                                ))
+                else:
+                    st.error(f"Could not fetch data for {ticker}")
+        else:
+            st.error("Could not identify ticker from input")
+    
+    # Popular stocks quick buttons
+    st.markdown("---")
+    st.markdown("#### Popular Stocks")
+    
+    popular_cols = st.columns(6)
+    popular_stocks = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA']
+    
+    pressed = {}
+    for col, ticker in zip(popular_cols, popular_stocks):
+        with col:
+            pressed[ticker] = st.button(ticker, use_container_width=True)
+    
+    clicked = next((ticker for ticker, hit in pressed.items() if hit), None)
+    if clicked is None:
+        return
+    
+    # One concurrent round trip fetches all six, so show them together under their buttons
+    quotes = fetch_many(chatbot.stock_fetcher, popular_stocks)
+    if not quotes[clicked]:
+        st.error(f"Could not fetch data for {clicked}")
+    shown = [(col, t, q) for col, t, q in zip(popular_cols, popular_stocks, map(quotes.get, popular_stocks)) if q]
+    if shown:
+        columns, tickers, data = zip(*shown)
+        render_many_prices(list(tickers),
+                           [q['price'] for q in data],
+                           [q['change'] for q in data],
+                           [q['change_percent'] for q in data],
+                           columns)
+
+def render_tab3(quant_df: Optional[pd.DataFrame] = None, news_df: Optional[pd.DataFrame] = None):
+    """Main render function for Tab 3"""
+    
+    # Initialize session state
+    SessionStateManager.initialize()
+    
+    st.title("AI Stock Market Assistant")
+    st.markdown("Get live prices, compare stocks, build portfolios, and receive AI-powered investment insights!")
+    
+    # Create sub-tabs
+    sub_tab1, sub_tab2, sub_tab3, sub_tab4 = st.tabs([
+        "Quick Lookup", 
+        "Compare Stocks", 
+        "Portfolio Builder",
+        "AI Chat"
+    ])
+    
+    # Initialize chatbot once (per distinct quant_df, not per rerun)
+    chatbot = get_chatbot(quant_df)
+    
+    # Each sub-tab is a fragment: its widgets rerun only that sub-tab, not all four
+    with sub_tab1:
+        _render_lookup_tab(chatbot)
+    
+    with sub_tab2:
+        _render_compare_tab(chatbot, quant_df)
+    
+    with sub_tab3:
+        _render_portfolio_tab()
+    
+    with sub_tab4:
+        _render_chat_tab(chatbot)
 
 # ============================================================================
 # STANDALONE TEST